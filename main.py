@@ -21,23 +21,13 @@ Examples:
     python main.py ab-test --comprehensive
 """
 
-import os
+from __future__ import annotations
+
 import sys
 import argparse
-from pathlib import Path
-
-# Add the project root to Python path for imports
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-
-# Set PYTHONPATH environment variable as well
-os.environ['PYTHONPATH'] = str(project_root)
+import importlib
 
 try:
-    from underwriting.cli.basic import main as basic_main
-    from underwriting.cli.ab_testing import main as ab_test_main
-    from underwriting.cli.web_server import main as web_server_main
-    from underwriting.cli.streamlit_server import main as streamlit_main
     from underwriting import __version__
 except ImportError as e:
     print(f"Error importing underwriting modules: {e}")
@@ -45,8 +35,24 @@ except ImportError as e:
     sys.exit(1)
 
 
-def create_parser():
-    """Create the main argument parser with subcommands."""
+def _load_command(module_name):
+    """Import a subcommand CLI module on demand and return its ``main``.
+    
+    Subcommand modules pull in LangChain, Flask or Streamlit, so they are only
+    imported once the matching command has been selected.
+    """
+    try:
+        module = importlib.import_module(f"underwriting.cli.{module_name}")
+    except ImportError as e:
+        print(f"Error importing underwriting modules: {e}")
+        print("Please ensure you're running from the project root directory.")
+        sys.exit(1)
+    
+    return module.main
+
+
+def _make_base_parser():
+    """Create the top-level argument parser and its subparsers action."""
     
     parser = argparse.ArgumentParser(
         prog="underwriting",
@@ -75,7 +81,12 @@ Examples:
         metavar="COMMAND"
     )
     
-    # Basic underwriting subcommand
+    return parser, subparsers
+
+
+def _add_basic_parser(subparsers):
+    """Add the basic underwriting subcommand."""
+    
     basic_parser = subparsers.add_parser(
         "basic",
         help="Basic underwriting operations",
@@ -94,6 +105,13 @@ Examples:
         help="Start interactive underwriting session"
     )
     
+    basic_parser.add_argument(
+        "--no-pause",
+        action="store_true",
+        help="Evaluate test applicants concurrently without pausing between them "
+             "(default when stdin is not a terminal)"
+    )
+    
     basic_parser.add_argument(
         "--applicant-id",
         type=str,
@@ -107,7 +125,12 @@ Examples:
         help="Path to underwriting rules file"
     )
     
-    # A/B testing subcommand
+    return basic_parser
+
+
+def _add_ab_test_parser(subparsers):
+    """Add the A/B testing subcommand."""
+    
     ab_parser = subparsers.add_parser(
         "ab-test",
         help="A/B testing operations",
@@ -166,7 +189,18 @@ Examples:
         help="Export results to JSON file"
     )
     
-    # Web server subcommand
+    ab_parser.add_argument(
+        "--response-cache",
+        type=str,
+        help="Reuse LLM responses cached in this SQLite file across runs"
+    )
+    
+    return ab_parser
+
+
+def _add_web_parser(subparsers):
+    """Add the web server subcommand."""
+    
     web_parser = subparsers.add_parser(
         "web",
         help="Web server operations",
@@ -199,7 +233,19 @@ Examples:
         help="Enable auto-reload on file changes"
     )
     
-    # Streamlit server subcommand
+    web_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of ASGI worker processes (default: number of CPUs)"
+    )
+    
+    return web_parser
+
+
+def _add_streamlit_parser(subparsers):
+    """Add the Streamlit server subcommand."""
+    
     streamlit_parser = subparsers.add_parser(
         "streamlit",
         help="Streamlit web application",
@@ -232,6 +278,52 @@ Examples:
         help="Do not automatically open browser"
     )
     
+    return streamlit_parser
+
+
+# Subparser builders keyed by command name
+_SUBPARSER_BUILDERS = {
+    "basic": _add_basic_parser,
+    "ab-test": _add_ab_test_parser,
+    "web": _add_web_parser,
+    "streamlit": _add_streamlit_parser
+}
+
+
+def _sniff_command(argv):
+    """Return the subcommand named in argv, or None if help comes first."""
+    
+    for token in argv:
+        if token in ("-h", "--help"):
+            return None
+        if not token.startswith("-"):
+            return token
+    
+    return None
+
+
+def create_parser(argv=None):
+    """
+    Create the main argument parser with subcommands.
+    
+    Only the subparser for the command named in ``argv`` (defaults to
+    ``sys.argv[1:]``) is built. All subparsers are added when no known
+    command is given or help is requested before one, so the top-level
+    help and error messages still list every command.
+    """
+    
+    parser, subparsers = _make_base_parser()
+    
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    command = _sniff_command(argv)
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for add_subparser in _SUBPARSER_BUILDERS.values():
+            add_subparser(subparsers)
+    
     return parser
 
 
@@ -248,89 +340,20 @@ def main():
     
     try:
         if args.command == "basic":
-            # Convert args to format expected by basic CLI
-            basic_args = []
-            
-            if args.test:
-                basic_args.append("--test")
-            elif args.interactive:
-                basic_args.append("--interactive")
-            elif args.applicant_id:
-                basic_args.extend(["--applicant-id", args.applicant_id])
-            
-            if args.rules_file != "config/rules/underwriting_rules.json":
-                basic_args.extend(["--rules-file", args.rules_file])
-            
-            # Override sys.argv for the basic CLI
-            original_argv = sys.argv
-            sys.argv = ["basic"] + basic_args
-            
-            try:
-                return basic_main()
-            finally:
-                sys.argv = original_argv
-                
+            basic_main = _load_command("basic")
+            return basic_main(args=args)
+        
         elif args.command == "ab-test":
-            # Convert args to format expected by A/B testing CLI
-            ab_args = []
-            
-            if args.list_configs:
-                ab_args.append("--list-configs")
-            elif args.rule_comparison:
-                ab_args.extend(["--rule-comparison"] + args.rule_comparison)
-            elif args.prompt_comparison:
-                ab_args.extend(["--prompt-comparison"] + args.prompt_comparison)
-            elif args.comprehensive:
-                ab_args.append("--comprehensive")
-            elif args.single_variant:
-                ab_args.extend(["--single-variant", args.single_variant])
-            
-            if args.confidence_level != 0.95:
-                ab_args.extend(["--confidence-level", str(args.confidence_level)])
-            
-            if args.monthly_applications != 10000:
-                ab_args.extend(["--monthly-applications", str(args.monthly_applications)])
-            
-            if args.export:
-                ab_args.extend(["--export", args.export])
-            
-            # Override sys.argv for the A/B testing CLI
-            original_argv = sys.argv
-            sys.argv = ["ab_test"] + ab_args
-            
-            try:
-                return ab_test_main()
-            finally:
-                sys.argv = original_argv
+            ab_test_main = _load_command("ab_testing")
+            return ab_test_main(args=args)
         
         elif args.command == "web":
-            # Convert args to format expected by web server CLI
-            web_args = []
-            
-            if args.host != "127.0.0.1":
-                web_args.extend(["--host", args.host])
-            
-            if args.port != 5000:
-                web_args.extend(["--port", str(args.port)])
-            
-            if args.debug:
-                web_args.append("--debug")
-            
-            if args.reload:
-                web_args.append("--reload")
-            
-            # Override sys.argv for the web server CLI
-            original_argv = sys.argv
-            sys.argv = ["web_server"] + web_args
-            
-            try:
-                return web_server_main()
-            finally:
-                sys.argv = original_argv
+            web_server_main = _load_command("web_server")
+            return web_server_main(args=args)
         
         elif args.command == "streamlit":
-            # Convert args to format expected by Streamlit CLI
-            return streamlit_main(args)
+            streamlit_main = _load_command("streamlit_server")
+            return streamlit_main(args=args)
         
         else:
             parser.print_help()
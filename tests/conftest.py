@@ -12,9 +12,9 @@ from pathlib import Path
 # Test configuration
 pytest_plugins = []
 
-# Set test environment variables
-os.environ["UNDERWRITING_LOG_LEVEL"] = "DEBUG"
-os.environ["UNDERWRITING_TEST_MODE"] = "true"
+# Set test environment variables without overriding values from the caller
+os.environ.setdefault("UNDERWRITING_LOG_LEVEL", "DEBUG")
+os.environ.setdefault("UNDERWRITING_TEST_MODE", "true")
 
 
 @pytest.fixture
@@ -38,11 +38,15 @@ def sample_config():
 @pytest.fixture
 def temp_config_file(tmp_path, sample_config):
     """Create temporary configuration file for testing."""
-    import json
-    
     config_file = tmp_path / "test_config.json"
-    with open(config_file, 'w') as f:
-        json.dump(sample_config, f)
+    
+    try:
+        import orjson
+        config_file.write_bytes(orjson.dumps(sample_config))
+    except ImportError:
+        import json
+        with open(config_file, 'w') as f:
+            json.dump(sample_config, f, separators=(',', ':'))
     
     return str(config_file)
 
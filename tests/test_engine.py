@@ -0,0 +1,71 @@
+"""
+Tests for the underwriting engine's applicant formatting.
+"""
+
+from datetime import date, timedelta
+
+from underwriting.core.engine import UnderwritingEngine
+from underwriting.core.models import (
+    Applicant, Driver, Vehicle, Violation, Claim,
+    LicenseStatus, ViolationType, ClaimType, VehicleCategory
+)
+
+
+def make_applicant(today):
+    """Build an applicant whose driver has one violation and one claim."""
+    driver = Driver(
+        driver_id="DRV001",
+        first_name="Jane",
+        last_name="Smith",
+        date_of_birth=date(1985, 6, 15),
+        license_number="D1234567",
+        license_state="CA",
+        license_status=LicenseStatus.VALID,
+        license_issue_date=date(2005, 6, 15),
+        license_expiration_date=date(2030, 6, 15),
+        violations=[
+            Violation(
+                violation_type=ViolationType.SPEEDING_15_OVER,
+                violation_date=today - timedelta(days=3 * 365 + 1)
+            )
+        ],
+        claims=[
+            Claim(
+                claim_type=ClaimType.AT_FAULT,
+                claim_date=today - timedelta(days=2 * 365 + 1),
+                claim_amount=5000.0
+            )
+        ]
+    )
+
+    return Applicant(
+        applicant_id="APP_TEST",
+        primary_driver=driver,
+        vehicles=[
+            Vehicle(
+                vin="1HGBH41JXMN109186",
+                year=2020,
+                make="Toyota",
+                model="Camry",
+                category=VehicleCategory.SEDAN
+            )
+        ],
+        credit_score=720,
+        territory="Urban"
+    )
+
+
+class TestFormatApplicantData:
+    """Tests for UnderwritingEngine._format_applicant_data."""
+
+    def test_includes_violation_and_claim_history(self):
+        # No rules file or LLM client is needed to format applicant data
+        engine = UnderwritingEngine.__new__(UnderwritingEngine)
+        applicant = make_applicant(date.today())
+
+        text = engine._format_applicant_data(applicant)
+
+        assert isinstance(text, str)
+        assert "(3 years ago)" in text
+        assert "$5,000.0" in text
+        assert "(2 years ago)" in text
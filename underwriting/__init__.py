@@ -18,28 +18,49 @@ Example usage:
     result = engine.evaluate_applicant(applicant)
 """
 
-__version__ = "1.0.0"
+from ._version import __version__
+
 __author__ = "Jeremiah Connelly"
 __email__ = "contact@jeremiahconnelly.dev"
 
-# Package-level imports for convenience
-from underwriting.core.models import (
-    Applicant,
-    Driver, 
-    Vehicle,
-    Violation,
-    Claim,
-    UnderwritingResult,
-    UnderwritingDecision
-)
+# Package-level exports are resolved lazily so that importing the package
+# (e.g. to read ``__version__``) does not pull in pydantic, LangChain or OpenAI.
+_LAZY_EXPORTS = {
+    # Core models
+    "Applicant": "underwriting.core.models",
+    "Driver": "underwriting.core.models",
+    "Vehicle": "underwriting.core.models",
+    "Violation": "underwriting.core.models",
+    "Claim": "underwriting.core.models",
+    "UnderwritingResult": "underwriting.core.models",
+    "UnderwritingDecision": "underwriting.core.models",
+    
+    # Core engine
+    "UnderwritingEngine": "underwriting.core.engine",
+    
+    # Exceptions
+    "UnderwritingError": "underwriting.core.exceptions",
+    "RuleValidationError": "underwriting.core.exceptions",
+    "LLMError": "underwriting.core.exceptions",
+    "ConfigurationError": "underwriting.core.exceptions",
+}
+
+
+def __getattr__(name):
+    """Import package-level exports on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-from underwriting.core.engine import UnderwritingEngine
-from underwriting.core.exceptions import (
-    UnderwritingError,
-    RuleValidationError,
-    LLMError,
-    ConfigurationError
-)
 
 # Version information
 VERSION_INFO = {
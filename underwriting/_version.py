@@ -0,0 +1,3 @@
+"""Version information for the underwriting package."""
+
+__version__ = "1.0.0"
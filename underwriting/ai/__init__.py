@@ -13,12 +13,14 @@ business logic.
 from .prompts import (
     PromptVariant,
     PromptTemplateFactory,
+    PromptConfig,
     PromptTestConfiguration
 )
 
 __all__ = [
     "PromptVariant",
     "PromptTemplateFactory", 
+    "PromptConfig",
     "PromptTestConfiguration"
 ]
 
@@ -4,89 +4,145 @@ Comprehensive A/B Testing Framework for Automobile Insurance Underwriting
 Command-line interface for running various A/B tests and generating reports.
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import argparse
+import dataclasses
 import json
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    from underwriting.core.models import Applicant
+    from underwriting.testing.ab_engine import TestConfiguration
+
+# Report banners
+_EQ50 = "=" * 50
+_EQ80 = "=" * 80
+_DASH50 = "-" * 50
+_DASH60 = "-" * 60
+
+# Heavy dependencies (LangChain, numpy, scipy) are imported inside the
+# methods that need them so that --help and --list-configs start quickly.
+
+# Integer codes used to tally decisions with np.bincount.
+# UnderwritingDecision is a str enum, so its members look up by value.
+DECISION_CODES = {
+    "accept": 0,
+    "deny": 1,
+    "adjudicate": 2
+}
 
-from underwriting.testing.ab_engine import ABTestEngine, TestConfiguration
-from underwriting.testing.statistical_analysis import StatisticalAnalyzer, BusinessImpactCalculator
-from underwriting.ai.prompts import PromptTemplateFactory, PromptTestConfiguration, PromptVariant
-from underwriting.data.sample_generator import create_sample_applicants
-from underwriting.core.models import Applicant
+# Rule-based configurations registered by every runner
+_RULE_CONFIGURATIONS = (
+    {
+        "variant_id": "standard",
+        "name": "Standard Rules",
+        "description": "Original balanced underwriting rules",
+        "rules_file": "underwriting_rules.json"
+    },
+    {
+        "variant_id": "conservative",
+        "name": "Conservative Rules",
+        "description": "Stricter underwriting criteria",
+        "rules_file": "underwriting_rules_conservative.json"
+    },
+    {
+        "variant_id": "liberal",
+        "name": "Liberal Rules",
+        "description": "More accepting underwriting criteria",
+        "rules_file": "underwriting_rules_liberal.json"
+    }
+)
+
+@lru_cache(maxsize=1)
+def _default_configurations() -> Tuple[TestConfiguration, ...]:
+    """Build the default rule and prompt test configurations once per process."""
+    
+    from underwriting.testing.ab_engine import TestConfiguration
+    from underwriting.ai.prompts import PromptTestConfiguration
+    
+    # Rule-based configurations
+    configs = [TestConfiguration(**spec) for spec in _RULE_CONFIGURATIONS]
+    
+    # Prompt-based configurations
+    prompt_config = PromptTestConfiguration()
+    for variant_id, config_data in prompt_config.get_all_configurations().items():
+        configs.append(TestConfiguration(
+            variant_id=f"prompt_{variant_id}",
+            name=config_data.name,
+            description=config_data.description,
+            rules_file=config_data.rules_file,
+            prompt_template=config_data.prompt_template,
+            parameters=config_data.parameters
+        ))
+    
+    return tuple(configs)
 
 class ABTestRunner:
     """Main A/B testing framework runner."""
     
-    def __init__(self):
-        """Initialize the A/B test runner."""
-        self.ab_engine = ABTestEngine()
+    def __init__(self, response_cache_path: Optional[str] = None):
+        """
+        Initialize the A/B test runner.
+        
+        Args:
+            response_cache_path: SQLite file used to reuse LLM responses across runs
+        """
+        from underwriting.testing.ab_engine import ABTestEngine
+        from underwriting.testing.response_cache import ResponseCache
+        from underwriting.testing.statistical_analysis import StatisticalAnalyzer, BusinessImpactCalculator
+        from underwriting.data.sample_generator import create_sample_applicants
+        from underwriting.ai.prompts import PromptVariant
+        
+        response_cache = ResponseCache(response_cache_path) if response_cache_path else None
+        self.ab_engine = ABTestEngine(response_cache=response_cache)
         self.statistical_analyzer = StatisticalAnalyzer()
         self.business_calculator = BusinessImpactCalculator()
         self.applicants = create_sample_applicants()
         
+        # Short prompt variant names mapped to their registered variant IDs
+        self._prompt_variant_map = {variant.value: f"prompt_{variant.value}" for variant in PromptVariant}
+        
         # Register default configurations
         self._register_default_configurations()
     
     def _register_default_configurations(self):
         """Register default test configurations."""
         
-        # Rule-based configurations
-        rule_configs = [
-            TestConfiguration(
-                variant_id="standard",
-                name="Standard Rules",
-                description="Original balanced underwriting rules",
-                rules_file="underwriting_rules.json"
-            ),
-            TestConfiguration(
-                variant_id="conservative",
-                name="Conservative Rules", 
-                description="Stricter underwriting criteria",
-                rules_file="underwriting_rules_conservative.json"
-            ),
-            TestConfiguration(
-                variant_id="liberal",
-                name="Liberal Rules",
-                description="More accepting underwriting criteria", 
-                rules_file="underwriting_rules_liberal.json"
-            )
-        ]
-        
-        for config in rule_configs:
+        for config in _default_configurations():
             self.ab_engine.register_test_configuration(config)
-        
-        # Prompt-based configurations
-        prompt_config = PromptTestConfiguration()
-        for variant_id, config_data in prompt_config.get_all_configurations().items():
-            test_config = TestConfiguration(
-                variant_id=f"prompt_{variant_id}",
-                name=config_data['name'],
-                description=config_data['description'],
-                rules_file=config_data['rules_file'],
-                prompt_template=config_data['prompt_template'],
-                parameters=config_data['parameters']
-            )
-            self.ab_engine.register_test_configuration(test_config)
     
     def run_rule_comparison(self, variant_a: str, variant_b: str, 
-                           applicants: Optional[List[Applicant]] = None) -> Dict[str, Any]:
-        """Run A/B test comparing different rule configurations."""
+                           applicants: Optional[List[Applicant]] = None,
+                           reuse_results: bool = False) -> Dict[str, Any]:
+        """
+        Run A/B test comparing different rule configurations.
+        
+        Args:
+            variant_a: First variant ID
+            variant_b: Second variant ID
+            applicants: Applicants to test (defaults to the sample applicants)
+            reuse_results: Reuse results already recorded for a variant
+                instead of evaluating its applicants again
+        """
         
         if applicants is None:
             applicants = self.applicants
         
-        print(f"\n{'='*80}")
+        print(f"\n{_EQ80}")
         print(f"RULE COMPARISON A/B TEST")
-        print(f"{'='*80}")
+        print(_EQ80)
         print(f"Variant A: {variant_a}")
         print(f"Variant B: {variant_b}")
         print(f"Sample Size: {len(applicants)} applicants")
         
         # Run comparison
-        batch_results = self.ab_engine.run_batch_comparison(applicants, variant_a, variant_b)
+        batch_results = self.ab_engine.run_batch_comparison(applicants, variant_a, variant_b,
+                                                           reuse_results=reuse_results)
         
         # Calculate metrics
         metrics = self.ab_engine.calculate_comparison_metrics(variant_a, variant_b)
@@ -95,12 +151,12 @@ class ABTestRunner:
         self.ab_engine.print_comparison_report(metrics)
         
         # Statistical analysis
-        results_a = [r for r in self.ab_engine.test_results if r.variant_id == variant_a]
-        results_b = [r for r in self.ab_engine.test_results if r.variant_id == variant_b]
+        results_a = self.ab_engine.get_variant_results(variant_a)
+        results_b = self.ab_engine.get_variant_results(variant_b)
         
-        print(f"\n{'-'*50}")
+        print(f"\n{_DASH50}")
         print("STATISTICAL ANALYSIS")
-        print(f"{'-'*50}")
+        print(_DASH50)
         
         # Chi-square test for decision distribution
         chi_square_test = self.statistical_analyzer.chi_square_test(results_a, results_b)
@@ -108,8 +164,7 @@ class ABTestRunner:
         print(f"  {chi_square_test.interpretation}")
         
         # Proportion tests for each decision type
-        for decision_type in ['accept', 'deny', 'adjudicate']:
-            prop_test = self.statistical_analyzer.proportion_z_test(results_a, results_b, decision_type)
+        for prop_test in self.statistical_analyzer.proportion_z_tests(results_a, results_b):
             print(f"\n{prop_test.test_name}:")
             print(f"  {prop_test.interpretation}")
         
@@ -130,23 +185,22 @@ class ABTestRunner:
         }
     
     def run_prompt_comparison(self, variant_a: str, variant_b: str,
-                             applicants: Optional[List[Applicant]] = None) -> Dict[str, Any]:
+                             applicants: Optional[List[Applicant]] = None,
+                             reuse_results: bool = False) -> Dict[str, Any]:
         """Run A/B test comparing different prompt templates."""
         
-        # Add prompt_ prefix if not present
-        if not variant_a.startswith('prompt_'):
-            variant_a = f"prompt_{variant_a}"
-        if not variant_b.startswith('prompt_'):
-            variant_b = f"prompt_{variant_b}"
+        # Map short names (e.g. "balanced") to their prompt_ variant IDs
+        variant_a = self._prompt_variant_map.get(variant_a, variant_a)
+        variant_b = self._prompt_variant_map.get(variant_b, variant_b)
         
-        return self.run_rule_comparison(variant_a, variant_b, applicants)
+        return self.run_rule_comparison(variant_a, variant_b, applicants, reuse_results)
     
     def run_comprehensive_test_suite(self) -> Dict[str, Any]:
         """Run a comprehensive suite of A/B tests."""
         
-        print(f"\n{'='*80}")
+        print(f"\n{_EQ80}")
         print(f"COMPREHENSIVE A/B TEST SUITE")
-        print(f"{'='*80}")
+        print(_EQ80)
         
         results = {}
         
@@ -157,18 +211,6 @@ class ABTestRunner:
             ("conservative", "liberal")
         ]
         
-        print(f"\n{'-'*60}")
-        print("RULE COMPARISON TESTS")
-        print(f"{'-'*60}")
-        
-        for variant_a, variant_b in rule_comparisons:
-            print(f"\nRunning: {variant_a} vs {variant_b}")
-            test_key = f"rules_{variant_a}_vs_{variant_b}"
-            results[test_key] = self.run_rule_comparison(variant_a, variant_b)
-            
-            # Clear results between tests
-            self.ab_engine.clear_results()
-        
         # Prompt comparison tests
         prompt_comparisons = [
             ("conservative", "liberal"),
@@ -176,17 +218,34 @@ class ABTestRunner:
             ("detailed", "concise")
         ]
         
-        print(f"\n{'-'*60}")
+        # Evaluate every variant once, all in one concurrent batch; the pairwise
+        # comparisons below then reuse these results instead of calling the LLM
+        variants = [variant for pair in rule_comparisons for variant in pair]
+        variants += [self._prompt_variant_map.get(variant, variant) for pair in prompt_comparisons for variant in pair]
+        variants = list(dict.fromkeys(variants))
+        print(f"\nEvaluating {len(self.applicants)} applicants across {len(variants)} variants...")
+        self.ab_engine.run_variants(self.applicants, variants)
+        
+        print(f"\n{_DASH60}")
+        print("RULE COMPARISON TESTS")
+        print(_DASH60)
+        
+        for variant_a, variant_b in rule_comparisons:
+            print(f"\nRunning: {variant_a} vs {variant_b}")
+            test_key = f"rules_{variant_a}_vs_{variant_b}"
+            # Served from the results recorded above
+            results[test_key] = self.run_rule_comparison(variant_a, variant_b, reuse_results=True)
+        
+        print(f"\n{_DASH60}")
         print("PROMPT TEMPLATE TESTS")
-        print(f"{'-'*60}")
+        print(_DASH60)
         
         for variant_a, variant_b in prompt_comparisons:
             print(f"\nRunning: {variant_a} vs {variant_b} prompts")
             test_key = f"prompts_{variant_a}_vs_{variant_b}"
-            results[test_key] = self.run_prompt_comparison(variant_a, variant_b)
-            
-            # Clear results between tests
-            self.ab_engine.clear_results()
+            results[test_key] = self.run_prompt_comparison(variant_a, variant_b, reuse_results=True)
+        
+        self.ab_engine.clear_results()
         
         return results
     
@@ -197,21 +256,19 @@ class ABTestRunner:
         if applicants is None:
             applicants = self.applicants
         
-        print(f"\n{'='*80}")
+        print(f"\n{_EQ80}")
         print(f"SINGLE VARIANT ANALYSIS: {variant_id.upper()}")
-        print(f"{'='*80}")
+        print(_EQ80)
+        
+        import numpy as np
         
         # Run all applicants through the variant
-        results = []
-        for applicant in applicants:
-            result_a, _ = self.ab_engine.run_single_comparison(applicant, variant_id, variant_id)
-            results.append(result_a)
+        results = self.ab_engine.run_single_variant(applicants, variant_id)
         
         # Calculate decision distribution
         total = len(results)
-        accept_count = sum(1 for r in results if r.decision.value == 'accept')
-        deny_count = sum(1 for r in results if r.decision.value == 'deny')
-        adjudicate_count = sum(1 for r in results if r.decision.value == 'adjudicate')
+        decisions = np.fromiter((DECISION_CODES[r.decision] for r in results), dtype=np.int8, count=total)
+        accept_count, deny_count, adjudicate_count = (int(c) for c in np.bincount(decisions, minlength=3))
         
         print(f"\nDECISION DISTRIBUTION:")
         print(f"  Accept: {accept_count}/{total} ({accept_count/total*100:.1f}%)")
@@ -219,7 +276,8 @@ class ABTestRunner:
         print(f"  Adjudicate: {adjudicate_count}/{total} ({adjudicate_count/total*100:.1f}%)")
         
         # Performance metrics
-        avg_time = sum(r.processing_time_ms for r in results) / len(results)
+        times = np.fromiter((r.processing_time_ms for r in results), dtype=np.float64, count=total)
+        avg_time = float(times.mean())
         error_count = sum(1 for r in results if r.error)
         
         print(f"\nPERFORMANCE METRICS:")
@@ -251,102 +309,115 @@ class ABTestRunner:
     def _print_business_impact(self, impact):
         """Print business impact analysis."""
         
-        print(f"\n{'-'*50}")
-        print("BUSINESS IMPACT ANALYSIS")
-        print(f"{'-'*50}")
-        
-        print(f"Monthly Application Volume: {impact.estimated_monthly_applications:,}")
-        print(f"Risk Level: {impact.risk_level}")
-        
-        print(f"\nDecision Rate Changes:")
-        print(f"  Accept Rate: {impact.accept_rate_change:+.1f}% ({impact.additional_accepts_monthly:+,} monthly)")
-        print(f"  Deny Rate: {impact.deny_rate_change:+.1f}% ({impact.additional_denies_monthly:+,} monthly)")
-        print(f"  Adjudicate Rate: {impact.adjudicate_rate_change:+.1f}% ({impact.additional_adjudications_monthly:+,} monthly)")
-        
-        print(f"\nEstimated Business Impact:")
-        print(f"  Loss Ratio Change: {impact.estimated_loss_ratio_change:+.3f}")
-        print(f"  Processing Cost Change: ${impact.estimated_processing_cost_change:+,.0f}/month")
-        print(f"  Market Share Impact: {impact.estimated_market_share_impact:+.2f}%")
+        # Build the whole report and write it once
+        lines = [
+            f"\n{_DASH50}",
+            "BUSINESS IMPACT ANALYSIS",
+            _DASH50,
+            f"Monthly Application Volume: {impact.estimated_monthly_applications:,}",
+            f"Risk Level: {impact.risk_level}",
+            
+            f"\nDecision Rate Changes:",
+            f"  Accept Rate: {impact.accept_rate_change:+.1f}% ({impact.additional_accepts_monthly:+,} monthly)",
+            f"  Deny Rate: {impact.deny_rate_change:+.1f}% ({impact.additional_denies_monthly:+,} monthly)",
+            f"  Adjudicate Rate: {impact.adjudicate_rate_change:+.1f}% ({impact.additional_adjudications_monthly:+,} monthly)",
+            
+            f"\nEstimated Business Impact:",
+            f"  Loss Ratio Change: {impact.estimated_loss_ratio_change:+.3f}",
+            f"  Processing Cost Change: ${impact.estimated_processing_cost_change:+,.0f}/month",
+            f"  Market Share Impact: {impact.estimated_market_share_impact:+.2f}%"
+        ]
         
         if impact.risk_factors:
-            print(f"\nRisk Factors:")
-            for factor in impact.risk_factors:
-                print(f"  • {factor}")
+            lines.append(f"\nRisk Factors:")
+            lines.extend(f"  • {factor}" for factor in impact.risk_factors)
         
         if impact.recommendations:
-            print(f"\nRecommendations:")
-            for rec in impact.recommendations:
-                print(f"  • {rec}")
+            lines.append(f"\nRecommendations:")
+            lines.extend(f"  • {rec}" for rec in impact.recommendations)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def export_comprehensive_report(self, results: Dict[str, Any], filename: str):
-        """Export comprehensive test results to file."""
+        """
+        Export comprehensive test results to file.
         
-        # Prepare export data
-        export_data = {
+        Each test is serialized and written as soon as it is built, so only
+        one test's export data is held in memory at a time.
+        """
+        
+        header = {
             'test_suite_timestamp': datetime.now().isoformat(),
             'test_configuration': {
                 'sample_size': len(self.applicants),
                 'confidence_level': self.statistical_analyzer.confidence_level,
                 'monthly_applications': self.business_calculator.monthly_applications
-            },
-            'test_results': {}
-        }
-        
-        # Process each test result
-        for test_key, test_data in results.items():
-            export_data['test_results'][test_key] = {
-                'metrics': {
-                    'variant_a_id': test_data['metrics'].variant_a_id,
-                    'variant_b_id': test_data['metrics'].variant_b_id,
-                    'total_tests': test_data['metrics'].total_tests,
-                    'agreement_rate': test_data['metrics'].agreement_rate,
-                    'decision_rates_a': {
-                        'accept': test_data['metrics'].accept_rate_a,
-                        'deny': test_data['metrics'].deny_rate_a,
-                        'adjudicate': test_data['metrics'].adjudicate_rate_a
-                    },
-                    'decision_rates_b': {
-                        'accept': test_data['metrics'].accept_rate_b,
-                        'deny': test_data['metrics'].deny_rate_b,
-                        'adjudicate': test_data['metrics'].adjudicate_rate_b
-                    },
-                    'performance': {
-                        'avg_processing_time_a': test_data['metrics'].avg_processing_time_a,
-                        'avg_processing_time_b': test_data['metrics'].avg_processing_time_b,
-                        'error_rate_a': test_data['metrics'].error_rate_a,
-                        'error_rate_b': test_data['metrics'].error_rate_b
-                    }
-                },
-                'statistical_significance': [
-                    {
-                        'test_name': test.test_name,
-                        'p_value': test.p_value,
-                        'is_significant': test.is_significant,
-                        'effect_size': test.effect_size,
-                        'interpretation': test.interpretation
-                    }
-                    for test in test_data['statistical_tests']
-                ],
-                'business_impact': {
-                    'risk_level': test_data['business_impact'].risk_level,
-                    'accept_rate_change': test_data['business_impact'].accept_rate_change,
-                    'deny_rate_change': test_data['business_impact'].deny_rate_change,
-                    'adjudicate_rate_change': test_data['business_impact'].adjudicate_rate_change,
-                    'estimated_loss_ratio_change': test_data['business_impact'].estimated_loss_ratio_change,
-                    'estimated_processing_cost_change': test_data['business_impact'].estimated_processing_cost_change,
-                    'risk_factors': test_data['business_impact'].risk_factors,
-                    'recommendations': test_data['business_impact'].recommendations
-                }
             }
+        }
         
-        # Write to file
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(b'{\n')
+            for key, value in header.items():
+                f.write(_json_dumps(key) + b': ' + _json_dumps(value) + b',\n')
+            
+            # Stream each test result into the test_results object
+            f.write(b'"test_results": {')
+            for i, (test_key, test_data) in enumerate(results.items()):
+                f.write(b',\n' if i else b'\n')
+                f.write(_json_dumps(test_key) + b': ' + _json_dumps(self._export_test_result(test_data)))
+            f.write(b'\n}\n}\n')
         
         print(f"\nComprehensive report exported to: {filename}")
+    
+    def _export_test_result(self, test_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the export data for a single test; dataclasses are serialized as-is."""
+        
+        return {
+            'metrics': test_data['metrics'],
+            'statistical_significance': test_data['statistical_tests'],
+            'business_impact': test_data['business_impact']
+        }
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the dataclasses and numpy scalars found in test results."""
+    
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, 'item'):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+    
+    return orjson.dumps(data, default=_json_default,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+def list_configurations():
+    """Print the available test configurations without building any engines."""
+    
+    from underwriting.ai.prompts import PromptTemplateFactory
+    
+    print("Available Test Configurations:")
+    print(_EQ50)
+    
+    print("\nRule Configurations:")
+    for spec in _RULE_CONFIGURATIONS:
+        print(f"  {spec['variant_id']}: {spec['name']}")
+        print(f"    {spec['description']}")
+    
+    print("\nPrompt Template Configurations:")
+    for variant_id, description in PromptTemplateFactory.get_variant_descriptions().items():
+        print(f"  {variant_id}: Prompt Template - {variant_id.title()}")
+        print(f"    {description}")
 
-def main():
-    """Main CLI entry point."""
+def create_parser():
+    """Create the argument parser for the A/B testing CLI."""
     
     parser = argparse.ArgumentParser(
         description="A/B Testing Framework for Automobile Insurance Underwriting",
@@ -385,6 +456,8 @@ Examples:
                        help='List available test configurations')
     parser.add_argument('--export', metavar='FILENAME',
                        help='Export results to JSON file')
+    parser.add_argument('--response-cache', metavar='FILENAME',
+                       help='Reuse LLM responses cached in this SQLite file across runs')
     
     # Analysis parameters
     parser.add_argument('--confidence-level', type=float, default=0.95,
@@ -392,7 +465,25 @@ Examples:
     parser.add_argument('--monthly-applications', type=int, default=10000,
                        help='Estimated monthly applications for business impact (default: 10000)')
     
-    args = parser.parse_args()
+    return parser
+
+def main(args=None, argv=None):
+    """
+    Main CLI entry point.
+    
+    Args:
+        args: Pre-parsed arguments (e.g. from ``main.py``)
+        argv: Argument list to parse when ``args`` is not given
+            (defaults to ``sys.argv[1:]``)
+    """
+    
+    if args is None:
+        args = create_parser().parse_args(argv)
+    
+    # Listing configurations needs neither an API key nor any engines
+    if args.list_configs:
+        list_configurations()
+        return
     
     # Check for OpenAI API key
     if not os.getenv("OPENAI_API_KEY"):
@@ -401,29 +492,10 @@ Examples:
         sys.exit(1)
     
     # Initialize runner
-    runner = ABTestRunner()
+    runner = ABTestRunner(response_cache_path=args.response_cache)
     runner.statistical_analyzer.confidence_level = args.confidence_level
     runner.business_calculator.monthly_applications = args.monthly_applications
     
-    # Handle list configs
-    if args.list_configs:
-        print("Available Test Configurations:")
-        print("=" * 50)
-        
-        print("\nRule Configurations:")
-        for config_id, config in runner.ab_engine.test_configurations.items():
-            if not config_id.startswith('prompt_'):
-                print(f"  {config_id}: {config.name}")
-                print(f"    {config.description}")
-        
-        print("\nPrompt Template Configurations:")
-        for config_id, config in runner.ab_engine.test_configurations.items():
-            if config_id.startswith('prompt_'):
-                print(f"  {config_id.replace('prompt_', '')}: {config.name}")
-                print(f"    {config.description}")
-        
-        return
-    
     # Run tests based on arguments
     results = None
     
@@ -446,7 +518,7 @@ Examples:
         print(f"\nSingle variant analysis completed for: {variant}")
     
     else:
-        parser.print_help()
+        create_parser().print_help()
         return
     
     # Export results if requested
@@ -6,13 +6,22 @@ Tests sample applicants through the LangChain/OpenAI underwriting engine.
 
 import os
 import sys
+import argparse
 from datetime import datetime
-from typing import List, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 
 from underwriting.core.engine import UnderwritingEngine
 from underwriting.data.sample_generator import create_sample_applicants, print_applicant_summary
 from underwriting.core.models import Applicant, UnderwritingResult, UnderwritingDecision
 
+# Report banners
+_EQ50 = "=" * 50
+_EQ60 = "=" * 60
+_EQ80 = "=" * 80
+_DASH40 = "-" * 40
+_DASH70 = "-" * 70
+
 class UnderwritingTestFramework:
     """Framework for testing underwriting decisions."""
     
@@ -21,23 +30,35 @@ class UnderwritingTestFramework:
         self.engine = UnderwritingEngine()
         self.test_results: List[Dict[str, Any]] = []
     
-    def run_single_test(self, applicant: Applicant, expected_decision: str = None) -> UnderwritingResult:
-        """Run underwriting evaluation for a single applicant."""
+    def run_single_test(self, applicant: Applicant, expected_decision: str = None,
+                        pending_result: Optional[Future] = None) -> UnderwritingResult:
+        """
+        Run underwriting evaluation for a single applicant.
+        
+        Args:
+            applicant: Applicant to evaluate
+            expected_decision: Expected decision to check the result against
+            pending_result: Evaluation already submitted to an executor, reported
+                instead of evaluating the applicant again
+        """
         
-        print(f"\n{'='*60}")
+        print(f"\n{_EQ60}")
         print(f"EVALUATING APPLICANT: {applicant.applicant_id}")
-        print(f"{'='*60}")
+        print(_EQ60)
         
         # Display applicant summary
         print_applicant_summary(applicant)
         
-        print(f"\n{'-'*40}")
+        print(f"\n{_DASH40}")
         print("UNDERWRITING EVALUATION IN PROGRESS...")
-        print(f"{'-'*40}")
+        print(_DASH40)
         
         # Run evaluation
         try:
-            result = self.engine.evaluate_applicant(applicant)
+            if pending_result is not None:
+                result = pending_result.result()
+            else:
+                result = self.engine.evaluate_applicant(applicant)
             
             # Display results
             print(f"\n*** UNDERWRITING DECISION ***")
@@ -95,12 +116,19 @@ class UnderwritingTestFramework:
             
             return error_result
     
-    def run_full_test_suite(self):
-        """Run the complete test suite with all sample applicants."""
+    def run_full_test_suite(self, pause: Optional[bool] = None):
+        """
+        Run the complete test suite with all sample applicants.
+        
+        Args:
+            pause: Wait for Enter between applicants. Defaults to pausing only
+                when stdin is a terminal; without pauses all applicants are
+                evaluated concurrently.
+        """
         
         print("AUTOMOBILE INSURANCE UNDERWRITING SYSTEM")
         print("LangChain + OpenAI Integration Test")
-        print("=" * 60)
+        print(_EQ60)
         
         # Check for API key
         if not os.getenv("OPENAI_API_KEY"):
@@ -124,14 +152,26 @@ class UnderwritingTestFramework:
         print(f"\nTesting {len(applicants)} sample applicants...")
         print(f"Expected results: 2 Accept, 2 Deny, 2 Adjudicate")
         
+        if pause is None:
+            pause = sys.stdin.isatty()
+        
         # Run tests
-        for i, applicant in enumerate(applicants):
-            expected = expected_results[i] if i < len(expected_results) else None
-            self.run_single_test(applicant, expected)
-            
-            # Pause between tests for readability
-            if i < len(applicants) - 1:
-                input("\nPress Enter to continue to next applicant...")
+        if pause:
+            for i, applicant in enumerate(applicants):
+                expected = expected_results[i] if i < len(expected_results) else None
+                self.run_single_test(applicant, expected)
+                
+                # Pause between tests for readability
+                if i < len(applicants) - 1:
+                    input("\nPress Enter to continue to next applicant...")
+        else:
+            # Nobody is reading between applicants, so make all LLM calls at once
+            # and report the results in applicant order
+            with ThreadPoolExecutor(max_workers=len(applicants) or 1) as executor:
+                futures = [executor.submit(self.engine.evaluate_applicant, applicant) for applicant in applicants]
+                for i, (applicant, future) in enumerate(zip(applicants, futures)):
+                    expected = expected_results[i] if i < len(expected_results) else None
+                    self.run_single_test(applicant, expected, future)
         
         # Display summary
         self.print_test_summary()
@@ -141,94 +181,115 @@ class UnderwritingTestFramework:
     def print_test_summary(self):
         """Print a summary of all test results."""
         
-        print(f"\n{'='*80}")
-        print("TEST SUMMARY")
-        print(f"{'='*80}")
+        # Build the whole report and write it once
+        lines = [
+            f"\n{_EQ80}",
+            "TEST SUMMARY",
+            _EQ80
+        ]
         
         total_tests = len(self.test_results)
         matches = sum(1 for r in self.test_results if r['match'] is True)
         errors = sum(1 for r in self.test_results if r['actual'] == 'ERROR')
         
-        print(f"Total Tests: {total_tests}")
-        print(f"Correct Predictions: {matches}")
-        print(f"Errors: {errors}")
-        print(f"Accuracy: {(matches/total_tests)*100:.1f}%" if total_tests > 0 else "N/A")
+        lines.append(f"Total Tests: {total_tests}")
+        lines.append(f"Correct Predictions: {matches}")
+        lines.append(f"Errors: {errors}")
+        lines.append(f"Accuracy: {(matches/total_tests)*100:.1f}%" if total_tests > 0 else "N/A")
         
-        print(f"\n{'ID':<8} {'Name':<20} {'Expected':<12} {'Actual':<12} {'Match':<8}")
-        print("-" * 70)
+        lines.append(f"\n{'ID':<8} {'Name':<20} {'Expected':<12} {'Actual':<12} {'Match':<8}")
+        lines.append(_DASH70)
         
         for result in self.test_results:
             match_symbol = "✓" if result['match'] is True else "✗" if result['match'] is False else "-"
             expected_str = result['expected'].upper() if result['expected'] else "N/A"
             actual_str = result['actual'].upper()
             
-            print(f"{result['applicant_id']:<8} {result['applicant_name']:<20} {expected_str:<12} {actual_str:<12} {match_symbol:<8}")
+            lines.append(f"{result['applicant_id']:<8} {result['applicant_name']:<20} {expected_str:<12} {actual_str:<12} {match_symbol:<8}")
         
-        print(f"\n{'='*80}")
+        lines.append(f"\n{_EQ80}")
         
         # Detailed results
-        print("\nDETAILED RESULTS:")
+        lines.append("\nDETAILED RESULTS:")
         for result in self.test_results:
-            print(f"\n{result['applicant_id']} - {result['applicant_name']}:")
-            print(f"  Decision: {result['actual'].upper()}")
-            print(f"  Reason: {result['reason']}")
+            lines.append(f"\n{result['applicant_id']} - {result['applicant_name']}:")
+            lines.append(f"  Decision: {result['actual'].upper()}")
+            lines.append(f"  Reason: {result['reason']}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def create_parser():
+    """Create the argument parser for the basic underwriting CLI."""
+    
+    parser = argparse.ArgumentParser(
+        description="Automobile Insurance Underwriting System"
+    )
+    
+    parser.add_argument('--test', action='store_true',
+                       help='Run full test suite')
+    parser.add_argument('--interactive', action='store_true',
+                       help='Run interactive mode')
+    parser.add_argument('--no-pause', action='store_true',
+                       help='Evaluate test applicants concurrently without pausing between them '
+                            '(default when stdin is not a terminal)')
+    
+    return parser
 
-def main():
-    """Main entry point for the application."""
+def main(args=None, argv=None):
+    """
+    Main entry point for the application.
+    
+    Args:
+        args: Pre-parsed arguments (e.g. from ``main.py``)
+        argv: Argument list to parse when ``args`` is not given
+            (defaults to ``sys.argv[1:]``)
+    """
     
-    # Check command line arguments
-    if len(sys.argv) > 1:
-        if sys.argv[1] in ['-h', '--help']:
-            print("Automobile Insurance Underwriting System")
-            print("Usage: python main.py [options]")
-            print("\nOptions:")
-            print("  -h, --help     Show this help message")
-            print("  --test         Run full test suite")
-            print("  --interactive  Run interactive mode")
-            return
-        
-        elif sys.argv[1] == '--test':
-            # Run automated test suite
-            framework = UnderwritingTestFramework()
-            success = framework.run_full_test_suite()
-            sys.exit(0 if success else 1)
-        
-        elif sys.argv[1] == '--interactive':
-            # Interactive mode - let user select applicants
-            framework = UnderwritingTestFramework()
-            applicants = create_sample_applicants()
+    if args is None:
+        args = create_parser().parse_args(argv)
+    
+    if args.test:
+        # Run automated test suite
+        framework = UnderwritingTestFramework()
+        success = framework.run_full_test_suite(pause=False if args.no_pause else None)
+        sys.exit(0 if success else 1)
+    
+    elif args.interactive:
+        # Interactive mode - let user select applicants
+        framework = UnderwritingTestFramework()
+        applicants = create_sample_applicants()
+        
+        while True:
+            print(f"\n{_EQ50}")
+            print("INTERACTIVE UNDERWRITING SYSTEM")
+            print(_EQ50)
+            print("Available applicants:")
             
-            while True:
-                print(f"\n{'='*50}")
-                print("INTERACTIVE UNDERWRITING SYSTEM")
-                print(f"{'='*50}")
-                print("Available applicants:")
-                
-                for i, applicant in enumerate(applicants):
-                    driver = applicant.primary_driver
-                    print(f"{i+1}. {applicant.applicant_id} - {driver.first_name} {driver.last_name} (Age {driver.age})")
-                
-                print("0. Exit")
+            for i, applicant in enumerate(applicants):
+                driver = applicant.primary_driver
+                print(f"{i+1}. {applicant.applicant_id} - {driver.first_name} {driver.last_name} (Age {driver.age})")
+            
+            print("0. Exit")
+            
+            try:
+                choice = int(input("\nSelect applicant to evaluate (0-6): "))
                 
-                try:
-                    choice = int(input("\nSelect applicant to evaluate (0-6): "))
-                    
-                    if choice == 0:
-                        break
-                    elif 1 <= choice <= len(applicants):
-                        framework.run_single_test(applicants[choice-1])
-                    else:
-                        print("Invalid choice. Please try again.")
-                        
-                except (ValueError, KeyboardInterrupt):
-                    print("\nExiting...")
+                if choice == 0:
                     break
-            
-            return
+                elif 1 <= choice <= len(applicants):
+                    framework.run_single_test(applicants[choice-1])
+                else:
+                    print("Invalid choice. Please try again.")
+                    
+            except (ValueError, KeyboardInterrupt):
+                print("\nExiting...")
+                break
+        
+        return
     
     # Default: run full test suite
     framework = UnderwritingTestFramework()
-    framework.run_full_test_suite()
+    framework.run_full_test_suite(pause=False if args.no_pause else None)
 
 if __name__ == "__main__":
     main()
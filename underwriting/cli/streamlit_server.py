@@ -53,12 +53,29 @@ def add_streamlit_parser(subparsers):
     
     return streamlit_parser
 
-def main(args):
-    """Main function for Streamlit CLI."""
+def main(args=None, argv=None):
+    """
+    Main function for Streamlit CLI.
+    
+    Args:
+        args: Pre-parsed arguments (e.g. from ``main.py``)
+        argv: Argument list to parse when ``args`` is not given
+            (defaults to ``sys.argv[1:]``)
+    """
+    if args is None:
+        parser = argparse.ArgumentParser()
+        subparsers = parser.add_subparsers(dest='command')
+        add_streamlit_parser(subparsers)
+        args = parser.parse_args(['streamlit', *(sys.argv[1:] if argv is None else argv)])
+    
     try:
-        # Get the current working directory (should be project root)
-        project_root = Path.cwd()
-        streamlit_app_path = project_root / "underwriting" / "streamlit" / "app.py"
+        # Locate the app from the installed package so the command works from
+        # any directory; the working directory is kept for config/rules lookups
+        import underwriting
+        package_dir = Path(underwriting.__file__).parent
+        project_root = package_dir.parent
+        working_dir = Path.cwd()
+        streamlit_app_path = package_dir / "streamlit" / "app.py"
         
         # Ensure the Streamlit app exists
         if not streamlit_app_path.exists():
@@ -83,10 +100,13 @@ def main(args):
         #elif not args.browser:
         #    cmd.extend(['--server.headless', 'true'])
         
-        # Add debug options
+        # Add debug options; outside debug mode nothing is reloaded, so skip
+        # watching the project tree (which can exhaust inotify watches)
         if args.debug:
             cmd.extend(['--server.runOnSave', 'true'])
             cmd.extend(['--server.fileWatcherType', 'auto'])
+        else:
+            cmd.extend(['--server.fileWatcherType', 'none'])
         
         print(f"🚀 Starting Streamlit Underwriting Application...")
         print(f"📍 Server will be available at: http://{args.host}:{args.port}")
@@ -97,7 +117,14 @@ def main(args):
         print("=" * 50)
         
         # Start Streamlit server
-        result = subprocess.run(cmd, env=env, cwd=project_root)
+        if os.name == 'posix':
+            # Replace this process with Streamlit rather than waiting on a
+            # child; Streamlit then receives Ctrl+C and signals directly
+            sys.stdout.flush()
+            os.execvpe(sys.executable, cmd, env)
+        
+        # os.exec* on Windows does not replace the process, so run a child
+        result = subprocess.run(cmd, env=env, cwd=working_dir)
         return result.returncode
         
     except KeyboardInterrupt:
@@ -109,10 +136,5 @@ def main(args):
 
 if __name__ == "__main__":
     # For testing the module directly
-    parser = argparse.ArgumentParser()
-    subparsers = parser.add_subparsers(dest='command')
-    add_streamlit_parser(subparsers)
-    
-    args = parser.parse_args(['streamlit', '--debug'])
-    sys.exit(main(args))
+    sys.exit(main(argv=['--debug']))
 
@@ -11,11 +11,9 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from underwriting.web.app import create_app
 
-
-def main():
-    """Main entry point for the web server CLI."""
+def create_parser():
+    """Create the argument parser for the web server CLI."""
     
     parser = argparse.ArgumentParser(
         description="Start the Automobile Insurance Underwriting Web Server"
@@ -46,12 +44,72 @@ def main():
         help='Enable auto-reload on file changes'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of ASGI worker processes (default: number of CPUs)'
+    )
+    
+    return parser
+
+
+def main(args=None, argv=None):
+    """
+    Main entry point for the web server CLI.
+    
+    Args:
+        args: Pre-parsed arguments (e.g. from ``main.py``)
+        argv: Argument list to parse when ``args`` is not given
+            (defaults to ``sys.argv[1:]``)
+    """
+    
+    if args is None:
+        args = create_parser().parse_args(argv)
     
     # Set environment variables
     if args.debug:
         os.environ['FLASK_DEBUG'] = 'true'
     
+    # Debugging and auto-reload need Flask's development server
+    if args.debug or args.reload:
+        return _run_development_server(args)
+    
+    try:
+        import uvicorn
+        import asgiref  # noqa: F401 - required by underwriting.web.asgi
+    except ImportError:
+        print("uvicorn/asgiref not installed; falling back to the Flask development server")
+        print("Install them with: pip install uvicorn asgiref")
+        return _run_development_server(args)
+    
+    workers = args.workers or os.cpu_count() or 1
+    
+    print(f"Starting Automobile Insurance Underwriting Web Server...")
+    print(f"Server will be available at: http://{args.host}:{args.port}")
+    print(f"ASGI workers: {workers}")
+    print("\nPress Ctrl+C to stop the server")
+    
+    try:
+        # Workers import the app by name so each process builds its own
+        uvicorn.run(
+            "underwriting.web.asgi:app",
+            host=args.host,
+            port=args.port,
+            workers=workers
+        )
+    except Exception as e:
+        print(f"Error starting server: {e}")
+        return 1
+    
+    return 0
+
+
+def _run_development_server(args):
+    """Run the Flask development server."""
+    
+    from underwriting.web.app import create_app
+    
     # Create Flask app
     app = create_app()
     
@@ -11,17 +11,6 @@ The core module is designed to be independent of specific AI providers,
 testing frameworks, or user interfaces.
 """
 
-from .models import (
-    Applicant,
-    Driver,
-    Vehicle, 
-    Violation,
-    Claim,
-    UnderwritingResult,
-    UnderwritingDecision
-)
-
-from .engine import UnderwritingEngine
 from .exceptions import (
     UnderwritingError,
     RuleValidationError,
@@ -29,6 +18,39 @@ from .exceptions import (
     ConfigurationError
 )
 
+# Models and the engine are resolved lazily so that importing the core package
+# (e.g. for its exceptions) does not pull in pydantic, LangChain or OpenAI.
+_LAZY_EXPORTS = {
+    # Models
+    "Applicant": "underwriting.core.models",
+    "Driver": "underwriting.core.models",
+    "Vehicle": "underwriting.core.models",
+    "Violation": "underwriting.core.models",
+    "Claim": "underwriting.core.models",
+    "UnderwritingResult": "underwriting.core.models",
+    "UnderwritingDecision": "underwriting.core.models",
+    
+    # Engine
+    "UnderwritingEngine": "underwriting.core.engine",
+}
+
+
+def __getattr__(name):
+    """Import core models and the engine on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 __all__ = [
     # Models
     "Applicant",
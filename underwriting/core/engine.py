@@ -1,15 +1,171 @@
 # Update the underwriting engine to support custom rules files and prompt templates
 
+from __future__ import annotations
+
+import asyncio
 import json
 import os
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-
-from langchain.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
-from langchain.schema import HumanMessage
+import re
+from typing import TYPE_CHECKING, Dict, Generator, List, Any, Optional
+from datetime import datetime, date
+from functools import lru_cache
 
 from .models import Applicant, Driver, Vehicle, Violation, Claim, UnderwritingResult, UnderwritingDecision
+from .exceptions import ApplicantValidationError
+
+# LangChain and OpenAI take seconds to import, so they are imported where they
+# are first needed; commands that never evaluate applicants skip them entirely
+if TYPE_CHECKING:
+    from langchain.prompts import PromptTemplate
+    from langchain_openai import ChatOpenAI
+
+# orjson (the "speedups" extra) parses rules files faster; its JSONDecodeError
+# subclasses json.JSONDecodeError, so error handling is the same either way
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Stands in for the applicant data in the system prompt; the data itself is
+# sent as a separate user message so the system prompt stays identical
+_APPLICANT_DATA_POINTER = "(provided in the next message)"
+
+# Matches the labelled fields of the LLM response in a single scan
+_RESPONSE_RE = re.compile(
+    r"^[ \t]*(?:"
+    r"Decision:(?P<decision>[^\n]*)"
+    r"|Primary Reason:(?P<reason>[^\n]*)"
+    r"|Triggered Rules:(?P<rules>[^\n]*)"
+    r"|Risk Factors:(?P<factors>[^\n]*)"
+    r")",
+    re.MULTILINE
+)
+_DECISION_RE = re.compile(r"ACCEPT|DENY|ADJUDICATE", re.IGNORECASE)
+_DECISION_MAP = {
+    "ACCEPT": UnderwritingDecision.ACCEPT,
+    "DENY": UnderwritingDecision.DENY,
+    "ADJUDICATE": UnderwritingDecision.ADJUDICATE
+}
+
+@lru_cache(maxsize=32)
+def _load_rules_file(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Parse a rules file, caching the result per path and modification time.
+    
+    The returned dict is shared between engines and must not be mutated.
+    """
+    
+    with open(path, 'rb') as f:
+        data = _json_loads(f.read())
+    return data.get('underwriting_rules', {})
+
+@lru_cache(maxsize=16)
+def _format_rules_text(path: str, mtime: float) -> str:
+    """Format a rules file for the prompt, caching the text per path and modification time."""
+    
+    rules = _load_rules_file(path, mtime)
+    parts = []
+    
+    # Hard stops
+    if 'hard_stops' in rules:
+        parts.append("HARD STOPS (Automatic Denial):\n")
+        for rule in rules['hard_stops'].get('rules', []):
+            parts.append(f"- {rule['rule_id']}: {rule['name']} - {rule['description']}\n")
+    
+    # Adjudication triggers
+    if 'adjudication_triggers' in rules:
+        parts.append("\nADJUDICATION TRIGGERS (Manual Review Required):\n")
+        for rule in rules['adjudication_triggers'].get('rules', []):
+            parts.append(f"- {rule['rule_id']}: {rule['name']} - {rule['description']}\n")
+    
+    # Acceptance criteria
+    if 'acceptance_criteria' in rules:
+        parts.append("\nACCEPTANCE CRITERIA (Automatic Approval):\n")
+        for rule in rules['acceptance_criteria'].get('rules', []):
+            parts.append(f"- {rule['rule_id']}: {rule['name']} - {rule['description']}\n")
+    
+    return "".join(parts)
+
+# Model settings used for every underwriting evaluation
+_LLM_SETTINGS = ("gpt-4", 0.1, 1000)
+
+def _http_client_options() -> Dict[str, Any]:
+    """
+    Connection pool settings for the HTTP clients used by ChatOpenAI.
+    
+    HTTP/2 multiplexing is enabled when the optional ``h2`` package is
+    installed.
+    """
+    
+    import importlib.util
+    import httpx
+    
+    return {
+        "http2": importlib.util.find_spec("h2") is not None,
+        "limits": httpx.Limits(max_connections=256, max_keepalive_connections=64),
+        "timeout": 60.0
+    }
+
+@lru_cache(maxsize=1)
+def _get_shared_http_client():
+    """
+    Create the sync HTTP client shared by every ChatOpenAI client.
+    
+    One tuned pool per process lets concurrent evaluations reuse keep-alive
+    connections (and TLS sessions) to the API. Async connections belong to
+    the event loop that opened them, so async clients are not shared; see
+    ``UnderwritingEngine.evaluate_applicants``.
+    """
+    
+    import atexit
+    import httpx
+    
+    client = httpx.Client(**_http_client_options())
+    atexit.register(client.close)
+    return client
+
+def _accepts_http_async_client() -> bool:
+    """
+    Whether ChatOpenAI takes separate sync and async HTTP clients.
+    
+    Older langchain-openai releases accept only a single http_client, which
+    is then also used for async calls, so custom clients are only passed
+    when both can be supplied.
+    """
+    
+    from langchain_openai import ChatOpenAI
+    
+    fields = getattr(ChatOpenAI, "model_fields", None) or getattr(ChatOpenAI, "__fields__", {})
+    return "http_async_client" in fields
+
+def _create_llm(model: str, temperature: float, max_tokens: int, api_key: Optional[str], **client_kwargs: Any) -> ChatOpenAI:
+    """Create a ChatOpenAI client with the given settings and HTTP clients."""
+    
+    from langchain_openai import ChatOpenAI
+    
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        openai_api_key=api_key,
+        **client_kwargs
+    )
+
+@lru_cache(maxsize=4)
+def _get_shared_llm(model: str, temperature: float, max_tokens: int, api_key: Optional[str]) -> ChatOpenAI:
+    """
+    Create a ChatOpenAI client, shared by every engine with the same settings.
+    
+    Engines are often created per request, so sharing the client reuses its
+    HTTP connection pool instead of opening new connections for each engine.
+    The API key is part of the cache key so a changed key gets a new client.
+    """
+    
+    client_kwargs = {}
+    if _accepts_http_async_client():
+        client_kwargs["http_client"] = _get_shared_http_client()
+    
+    return _create_llm(model, temperature, max_tokens, api_key, **client_kwargs)
 
 class UnderwritingEngine:
     """Enhanced underwriting engine with A/B testing support."""
@@ -18,14 +174,15 @@ class UnderwritingEngine:
         """Initialize the underwriting engine with configurable rules and prompts."""
         
         # Load underwriting rules from specified JSON file
-        self.rules_file = ".\\config\\rules\\" + rules_file
+        self.rules_file = os.path.join(".", "config", "rules", rules_file)
         self.rules = self._load_rules()
+        self._rules_text = _format_rules_text(*self._rules_key)
         #print(f"Loaded underwriting rules from {self.rules_file}")
 
         # Initialize OpenAI client (lazy initialization to avoid API key issues during config listing)
         self.llm = None
         
-        # Set prompt template
+        # Set prompt template (this also renders the system prompt)
         if prompt_template:
             self.prompt_template = prompt_template
         else:
@@ -35,9 +192,11 @@ class UnderwritingEngine:
         """Load underwriting rules from JSON file."""
         
         try:
-            with open(self.rules_file, 'r') as f:
-                data = json.load(f)
-                return data.get('underwriting_rules', {})
+            path = os.path.abspath(self.rules_file)
+            
+            # Identifies this version of the rules file in the module-level caches
+            self._rules_key = (path, os.path.getmtime(path))
+            return _load_rules_file(*self._rules_key)
         except FileNotFoundError:
             raise FileNotFoundError(f"Rules file not found: {self.rules_file}")
         except json.JSONDecodeError as e:
@@ -46,6 +205,8 @@ class UnderwritingEngine:
     def _create_default_prompt_template(self) -> PromptTemplate:
         """Create the default balanced prompt template."""
         
+        from langchain.prompts import PromptTemplate
+        
         template = """You are an expert automobile insurance underwriter. Your task is to evaluate an insurance applicant based on established underwriting rules and make one of three decisions: ACCEPT, DENY, or ADJUDICATE.
 
 UNDERWRITING RULES:
@@ -81,113 +242,130 @@ Please evaluate the applicant now:"""
         )
     
     def _format_applicant_data(self, applicant: Applicant) -> str:
-        """Format applicant data for the prompt."""
+        """
+        Format applicant data for the prompt.
+        
+        The text does not depend on the engine, so it is cached on the
+        applicant and reused when the same applicant is evaluated by several
+        engines (e.g. A/B test variants). Ages and "years ago" depend on the
+        current date, so the cached text is only reused on the same day.
+        """
+        
+        today = date.today()
+        cached = applicant._prompt_data
+        if cached is not None and cached[0] == today:
+            return cached[1]
         
-        # Primary driver info
+        applicant_data = self._render_applicant_data(applicant, today)
+        applicant._prompt_data = (today, applicant_data)
+        return applicant_data
+    
+    def _render_applicant_data(self, applicant: Applicant, today: date) -> str:
+        """Render the applicant data text for ``_format_applicant_data``."""
+        
+        import numpy as np
+        
+        today_np = np.datetime64(today, 'D')
+        
+        # Primary driver info; the leading empty entry starts the data on a new line
         driver = applicant.primary_driver
-        driver_info = f"""
-PRIMARY DRIVER:
-- Name: {driver.first_name} {driver.last_name}
-- Age: {driver.age}
-- License Status: {driver.license_status}
-- License State: {driver.license_state}
-- Years Licensed: {driver.years_licensed}"""
+        parts = [
+            "",
+            "PRIMARY DRIVER:",
+            f"- Name: {driver.first_name} {driver.last_name}",
+            f"- Age: {driver.age}",
+            f"- License Status: {driver.license_status}",
+            f"- License State: {driver.license_state}",
+            f"- Years Licensed: {driver.years_licensed}"
+        ]
         
         # Violations
-        violations_info = ""
         if driver.violations:
-            violations_info = "\nVIOLATIONS:"
-            for violation in driver.violations:
-                years_ago = (datetime.now().date() - violation.date).days // 365
-                violations_info += f"\n- {violation.violation_type} ({years_ago} years ago)"
+            parts.append("VIOLATIONS:")
+            # Years since each violation, computed for all violations at once
+            violation_years = (today_np - driver.violation_dates_np).astype(np.int64) // 365
+            for violation, years_ago in zip(driver.violations, violation_years.tolist()):
+                parts.append(f"- {violation.violation_type} ({years_ago} years ago)")
         else:
-            violations_info = "\nVIOLATIONS: None"
+            parts.append("VIOLATIONS: None")
         
         # Claims
-        claims_info = ""
         if driver.claims:
-            claims_info = "\nCLAIMS HISTORY:"
-            for claim in driver.claims:
-                years_ago = (datetime.now().date() - claim.date).days // 365
-                claims_info += f"\n- {claim.claim_type}: ${claim.amount:,} ({years_ago} years ago)"
+            parts.append("CLAIMS HISTORY:")
+            claim_years = (today_np - driver.claim_dates_np).astype(np.int64) // 365
+            for claim, years_ago in zip(driver.claims, claim_years.tolist()):
+                parts.append(f"- {claim.claim_type}: ${claim.claim_amount:,} ({years_ago} years ago)")
         else:
-            claims_info = "\nCLAIMS HISTORY: None"
+            parts.append("CLAIMS HISTORY: None")
         
         # Vehicles
-        vehicles_info = "\nVEHICLES:"
+        parts.append("VEHICLES:")
         for vehicle in applicant.vehicles:
-            vehicles_info += f"\n- {vehicle.year} {vehicle.make} {vehicle.model} ({vehicle.vehicle_type})"
+            parts.append(f"- {vehicle.year} {vehicle.make} {vehicle.model} ({vehicle.vehicle_type})")
         
         # Other info
-        other_info = f"""
-CREDIT SCORE: {applicant.credit_score}
-COVERAGE LAPSE: {applicant.prior_insurance_lapse_days} days
-TERRITORY: {applicant.territory}
-REQUESTED COVERAGE: {applicant.coverage_requested}"""
+        parts.append(f"CREDIT SCORE: {applicant.credit_score}")
+        parts.append(f"COVERAGE LAPSE: {applicant.prior_insurance_lapse_days} days")
+        parts.append(f"TERRITORY: {applicant.territory}")
+        parts.append(f"REQUESTED COVERAGE: {applicant.coverage_requested}")
         
-        return driver_info + violations_info + claims_info + vehicles_info + other_info
+        return "\n".join(parts)
     
     def _format_rules(self) -> str:
         """Format rules for the prompt."""
         
-        rules_text = ""
-        
-        # Hard stops
-        if 'hard_stops' in self.rules:
-            rules_text += "HARD STOPS (Automatic Denial):\n"
-            for rule in self.rules['hard_stops'].get('rules', []):
-                rules_text += f"- {rule['rule_id']}: {rule['name']} - {rule['description']}\n"
-        
-        # Adjudication triggers
-        if 'adjudication_triggers' in self.rules:
-            rules_text += "\nADJUDICATION TRIGGERS (Manual Review Required):\n"
-            for rule in self.rules['adjudication_triggers'].get('rules', []):
-                rules_text += f"- {rule['rule_id']}: {rule['name']} - {rule['description']}\n"
-        
-        # Acceptance criteria
-        if 'acceptance_criteria' in self.rules:
-            rules_text += "\nACCEPTANCE CRITERIA (Automatic Approval):\n"
-            for rule in self.rules['acceptance_criteria'].get('rules', []):
-                rules_text += f"- {rule['rule_id']}: {rule['name']} - {rule['description']}\n"
+        return self._rules_text
+    
+    @property
+    def prompt_template(self) -> PromptTemplate:
+        """Prompt template used to evaluate applicants."""
+        return self._prompt_template
+    
+    @prompt_template.setter
+    def prompt_template(self, prompt_template: PromptTemplate):
+        """
+        Set the prompt template and render the applicant-independent prompt.
         
-        return rules_text
+        The rules never change for the lifetime of the engine, so the system
+        prompt is rendered once here rather than per applicant. It is
+        identical for every call, which also lets OpenAI's automatic prompt
+        caching reuse it across applicants.
+        """
+        self._prompt_template = prompt_template
+        self._system_prompt = prompt_template.format(
+            rules=self._rules_text,
+            applicant_data=_APPLICANT_DATA_POINTER
+        )
     
     def _parse_llm_response(self, response_text: str, applicant_id: str) -> UnderwritingResult:
         """Parse the LLM response into an UnderwritingResult."""
         
-        lines = response_text.strip().split('\n')
-        
         # Initialize default values
         decision = UnderwritingDecision.ADJUDICATE
         reason = "Unable to parse LLM response"
         triggered_rules = []
         risk_factors = []
         
-        # Parse response
-        for line in lines:
-            line = line.strip()
+        # Parse response; later occurrences of a field override earlier ones
+        for match in _RESPONSE_RE.finditer(response_text):
+            field = match.lastgroup
+            value = match.group(field).strip()
             
-            if line.startswith('Decision:'):
-                decision_text = line.split(':', 1)[1].strip().upper()
-                if 'ACCEPT' in decision_text:
-                    decision = UnderwritingDecision.ACCEPT
-                elif 'DENY' in decision_text:
-                    decision = UnderwritingDecision.DENY
-                elif 'ADJUDICATE' in decision_text:
-                    decision = UnderwritingDecision.ADJUDICATE
+            if field == 'decision':
+                decision_match = _DECISION_RE.search(value)
+                if decision_match:
+                    decision = _DECISION_MAP[decision_match.group().upper()]
             
-            elif line.startswith('Primary Reason:'):
-                reason = line.split(':', 1)[1].strip()
+            elif field == 'reason':
+                reason = value
             
-            elif line.startswith('Triggered Rules:'):
-                rules_text = line.split(':', 1)[1].strip()
-                if rules_text and rules_text != 'None':
-                    triggered_rules = [r.strip() for r in rules_text.split(',')]
+            elif field == 'rules':
+                if value and value != 'None':
+                    triggered_rules = [r.strip() for r in value.split(',')]
             
-            elif line.startswith('Risk Factors:'):
-                factors_text = line.split(':', 1)[1].strip()
-                if factors_text and factors_text != 'None':
-                    risk_factors = [f.strip() for f in factors_text.split(',')]
+            elif field == 'factors':
+                if value and value != 'None':
+                    risk_factors = [f.strip() for f in value.split(',')]
         
         return UnderwritingResult(
             applicant_id=applicant_id,
@@ -201,46 +379,159 @@ REQUESTED COVERAGE: {applicant.coverage_requested}"""
     def _get_llm(self):
         """Get LLM client with lazy initialization."""
         if self.llm is None:
-            self.llm = ChatOpenAI(
-                model="gpt-4",
-                temperature=0.1,
-                max_tokens=1000,
-                openai_api_key=os.getenv("OPENAI_API_KEY")
-            )
+            self.llm = _get_shared_llm(*_LLM_SETTINGS, os.getenv("OPENAI_API_KEY"))
         return self.llm
     
-    def evaluate_applicant(self, applicant: Applicant) -> UnderwritingResult:
-        """Evaluate an applicant using the LLM and return the result."""
+    def _build_messages(self, applicant: Applicant, applicant_data: Optional[str] = None) -> list:
+        """Build the LLM messages: stable system prompt first, applicant-specific data last."""
+        
+        from langchain.schema import HumanMessage, SystemMessage
+        
+        if applicant_data is None:
+            try:
+                applicant_data = self._format_applicant_data(applicant)
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                raise ApplicantValidationError(
+                    f"Could not format applicant data: {e}",
+                    applicant_id=applicant.applicant_id
+                ) from e
+        
+        return [
+            SystemMessage(content=self._system_prompt),
+            HumanMessage(content="APPLICANT INFORMATION:" + applicant_data)
+        ]
+    
+    def _error_result(self, applicant: Applicant, error: Exception) -> UnderwritingResult:
+        """Build the result returned when the LLM call fails."""
+        
+        return UnderwritingResult(
+            applicant_id=applicant.applicant_id,
+            decision=UnderwritingDecision.ADJUDICATE,
+            reason=f"System error: {str(error)}",
+            triggered_rules=[],
+            risk_factors=["System Error"],
+            timestamp=datetime.now()
+        )
+    
+    def evaluate_applicant(self, applicant: Applicant, applicant_data: Optional[str] = None) -> UnderwritingResult:
+        """
+        Evaluate an applicant using the LLM and return the result.
+        
+        Args:
+            applicant: Applicant to evaluate
+            applicant_data: Applicant data already formatted by
+                ``_format_applicant_data``, e.g. when the same applicant is
+                evaluated by several A/B test variants
+        
+        Failed OpenAI calls (after the client's own retries with backoff) are
+        returned as an ADJUDICATE result flagged "System Error". Invalid
+        applicant data raises ApplicantValidationError, and other errors
+        propagate to the caller.
+        """
+        
+        import openai
         
         try:
-            # Format data for prompt
-            rules_text = self._format_rules()
-            applicant_data = self._format_applicant_data(applicant)
-            
-            # Create prompt
-            prompt = self.prompt_template.format(
-                rules=rules_text,
-                applicant_data=applicant_data
-            )
+            messages = self._build_messages(applicant, applicant_data)
             
             # Call LLM
-            llm = self._get_llm()
-            response = llm.invoke([HumanMessage(content=prompt)])
-            response_text = response.content
+            response = self._get_llm().invoke(messages)
             
             # Parse response
-            result = self._parse_llm_response(response_text, applicant.applicant_id)
+            return self._parse_llm_response(response.content, applicant.applicant_id)
             
-            return result
+        except openai.APIError as e:
+            return self._error_result(applicant, e)
+    
+    def stream_evaluate(self, applicant: Applicant, applicant_data: Optional[str] = None) -> Generator[str, None, UnderwritingResult]:
+        """
+        Evaluate an applicant, yielding the LLM response text as it arrives.
+        
+        The parsed result is the generator's return value, so callers that
+        display the text take it with ``result = yield from ...``. Errors are
+        handled as in ``evaluate_applicant``.
+        
+        Args:
+            applicant: Applicant to evaluate
+            applicant_data: Applicant data already formatted by
+                ``_format_applicant_data``
+        """
+        
+        import openai
+        
+        messages = self._build_messages(applicant, applicant_data)
+        chunks = []
+        
+        try:
+            for chunk in self._get_llm().stream(messages):
+                chunks.append(chunk.content)
+                yield chunk.content
+        except openai.APIError as e:
+            return self._error_result(applicant, e)
+        
+        return self._parse_llm_response("".join(chunks), applicant.applicant_id)
+    
+    async def evaluate_applicant_async(self, applicant: Applicant, applicant_data: Optional[str] = None,
+                                       llm: Optional[ChatOpenAI] = None) -> UnderwritingResult:
+        """
+        Asynchronous version of ``evaluate_applicant`` using ``llm.ainvoke``.
+        
+        Args:
+            applicant: Applicant to evaluate
+            applicant_data: Applicant data already formatted by
+                ``_format_applicant_data``
+            llm: Client to call instead of the engine's shared one, e.g. one
+                whose async connections belong to the running event loop
+        """
+        
+        import openai
+        
+        try:
+            messages = self._build_messages(applicant, applicant_data)
             
-        except Exception as e:
-            # Return error result
-            return UnderwritingResult(
-                applicant_id=applicant.applicant_id,
-                decision=UnderwritingDecision.ADJUDICATE,
-                reason=f"System error: {str(e)}",
-                triggered_rules=[],
-                risk_factors=["System Error"],
-                timestamp=datetime.now()
-            )
-
+            # Call LLM without blocking the event loop
+            response = await (llm or self._get_llm()).ainvoke(messages)
+            
+            # Parse response
+            return self._parse_llm_response(response.content, applicant.applicant_id)
+            
+        except openai.APIError as e:
+            return self._error_result(applicant, e)
+    
+    def evaluate_applicants(self, applicants: List[Applicant], concurrency: int = 10) -> List[UnderwritingResult]:
+        """
+        Evaluate several applicants with concurrent LLM calls.
+        
+        Runs its own event loop, so it must not be called from async code;
+        gather ``evaluate_applicant_async`` calls there instead.
+        
+        Args:
+            applicants: Applicants to evaluate
+            concurrency: Maximum number of LLM calls in flight at once
+        
+        Returns:
+            Results in the same order as ``applicants``
+        """
+        
+        async def evaluate_all():
+            import httpx
+            
+            # asyncio.run closes its loop afterwards, and pooled async
+            # connections cannot outlive their loop, so each batch gets its own
+            # async client (closed here) and a ChatOpenAI that uses it
+            async with httpx.AsyncClient(**_http_client_options()) as http_async_client:
+                client_kwargs = {}
+                if _accepts_http_async_client():
+                    client_kwargs["http_client"] = _get_shared_http_client()
+                    client_kwargs["http_async_client"] = http_async_client
+                llm = _create_llm(*_LLM_SETTINGS, os.getenv("OPENAI_API_KEY"), **client_kwargs)
+                
+                semaphore = asyncio.Semaphore(concurrency)
+                
+                async def evaluate(applicant):
+                    async with semaphore:
+                        return await self.evaluate_applicant_async(applicant, llm=llm)
+                
+                return await asyncio.gather(*(evaluate(applicant) for applicant in applicants))
+        
+        return list(asyncio.run(evaluate_all()))
@@ -1,7 +1,8 @@
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field
+from typing import Dict, List, Any, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, model_validator
 from datetime import datetime, date
 from enum import Enum
+from functools import cached_property, lru_cache
 
 class LicenseStatus(str, Enum):
     VALID = "valid"
@@ -46,6 +47,11 @@ class UnderwritingDecision(str, Enum):
     DENY = "deny"
     ADJUDICATE = "adjudicate"
 
+@lru_cache(maxsize=1024)
+def _whole_years_between(start: date, today: date) -> int:
+    """Whole years from start to today, memoized per (start, today) pair."""
+    return today.year - start.year - ((today.month, today.day) < (start.month, start.day))
+
 class Violation(BaseModel):
     violation_type: ViolationType
     violation_date: date
@@ -64,7 +70,14 @@ class Vehicle(BaseModel):
     make: str
     model: str
     category: VehicleCategory
-    vehicle_type: VehicleCategory
+    # Only needs to be given when it differs from the category
+    vehicle_type: Optional[VehicleCategory] = None
+
+    @model_validator(mode='after')
+    def _default_vehicle_type(self) -> 'Vehicle':
+        if self.vehicle_type is None:
+            self.vehicle_type = self.category
+        return self
 
 class Driver(BaseModel):
     driver_id: str
@@ -79,17 +92,29 @@ class Driver(BaseModel):
     violations: List[Violation] = Field(default_factory=list)
     claims: List[Claim] = Field(default_factory=list)
     
+    # Keyed on today's date rather than cached per instance: sample drivers
+    # live for the whole process, and ages must roll over on anniversaries
+    @computed_field
     @property
-    def years_licensed_calc(self) -> int:
-        today = date.today()
-        return today.year - self.license_issue_date.year - ((today.month, today.day) < (self.license_issue_date.month, self.license_issue_date.day))
-    
-    years_licensed: int = years_licensed_calc
+    def years_licensed(self) -> int:
+        return _whole_years_between(self.license_issue_date, date.today())
 
+    @computed_field
     @property
     def age(self) -> int:
-        today = date.today()
-        return today.year - self.date_of_birth.year - ((today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day))
+        return _whole_years_between(self.date_of_birth, date.today())
+
+    @cached_property
+    def violation_dates_np(self):
+        """Violation dates as a NumPy ``datetime64[D]`` array, in list order."""
+        import numpy as np
+        return np.array([v.violation_date for v in self.violations], dtype='datetime64[D]')
+
+    @cached_property
+    def claim_dates_np(self):
+        """Claim dates as a NumPy ``datetime64[D]`` array, in list order."""
+        import numpy as np
+        return np.array([c.claim_date for c in self.claims], dtype='datetime64[D]')
 
 class Applicant(BaseModel):
     applicant_id: str
@@ -102,6 +127,9 @@ class Applicant(BaseModel):
     territory: str
     coverage_requested: List[str] = Field(default_factory=list)
     
+    # Prompt text formatted by UnderwritingEngine, with the date it was formatted on
+    _prompt_data: Optional[Tuple[date, str]] = PrivateAttr(default=None)
+    
     @property
     def all_drivers(self) -> List[Driver]:
         return [self.primary_driver] + self.additional_drivers
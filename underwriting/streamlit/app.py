@@ -10,12 +10,11 @@ import os
 import sys
 from pathlib import Path
 
-# Add project root to path
+# Add project root to path; Streamlit re-executes this script on every
+# rerun, so only insert it once
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-# Load environment variables
-from underwriting.utils.env_loader import load_environment_variables
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 def configure_page():
     """Configure the Streamlit page settings."""
@@ -43,9 +42,8 @@ def configure_page():
         }
     )
 
-def load_custom_css():
-    """Load custom CSS for enhanced styling."""
-    st.markdown("""
+# Custom CSS, built once at import rather than on every rerun
+_CUSTOM_CSS = """
     <style>
     /* Main theme colors */
     :root {
@@ -219,7 +217,35 @@ def load_custom_css():
         padding-bottom: 2rem;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def load_custom_css():
+    """
+    Load custom CSS for enhanced styling.
+    
+    Streamlit removes elements that a rerun does not emit again, so the
+    style block has to be written on every run rather than once per session.
+    """
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+# Sidebar help text
+_GETTING_STARTED_HELP = """
+            1. **Evaluate**: Test applicant using the evaluation form. 
+            2. **A/B Test**: Compare different rule configurations
+            3. **Configure**: Adjust system settings as needed
+            """
+
+_DECISION_TYPES_HELP = """
+            - **✅ ACCEPTED**: The Applicant is Approved for Coverage
+            - **❌ DENY**: The Application is Denied Coverage  
+            - **⚖️ ADJUDICATE**: Manual review required for Applicant
+            """
+
+def openai_key_configured() -> bool:
+    """Whether OPENAI_API_KEY is set; checked once per session until refreshed."""
+    if '_openai_ok' not in st.session_state:
+        st.session_state['_openai_ok'] = os.environ.get('OPENAI_API_KEY', '').strip() != ''
+    return st.session_state['_openai_ok']
 
 def show_sidebar():
     """Display the sidebar with navigation and system info."""
@@ -230,8 +256,7 @@ def show_sidebar():
         st.markdown("### 📊 System Status")
         
         # Check OpenAI API key
-        openai_key = os.environ.get('OPENAI_API_KEY')
-        if openai_key and openai_key.strip():
+        if openai_key_configured():
             st.success("✅ OpenAI API Connected")
         else:
             st.error("❌ OpenAI API Key Missing")
@@ -251,29 +276,38 @@ def show_sidebar():
         st.markdown("### ⚡ Quick Actions")
         
         if st.button("🔄 Refresh Data", use_container_width=True):
+            # Re-check the API key on the next run
+            st.session_state.pop('_openai_ok', None)
             st.rerun()
         
-        if st.button("📋 Sample Test", use_container_width=True):
-            st.switch_page("pages/02_📋_Evaluate.py")
+        st.page_link("pages/02_📋_Evaluate.py", label="📋 Sample Test", use_container_width=True)
         
-        if st.button("🧪 A/B Testing", use_container_width=True):
-            st.switch_page("pages/03_🧪_AB_Testing.py")
+        st.page_link("pages/03_🧪_AB_Testing.py", label="🧪 A/B Testing", use_container_width=True)
         
         # Help section
         st.markdown("### 💡 Help")
         with st.expander("Getting Started"):
-            st.markdown("""
-            1. **Evaluate**: Test applicant using the evaluation form. 
-            2. **A/B Test**: Compare different rule configurations
-            3. **Configure**: Adjust system settings as needed
-            """)
+            st.markdown(_GETTING_STARTED_HELP)
         
         with st.expander("Decision Result Types"):
-            st.markdown("""
-            - **✅ ACCEPTED**: The Applicant is Approved for Coverage
-            - **❌ DENY**: The Application is Denied Coverage  
-            - **⚖️ ADJUDICATE**: Manual review required for Applicant
-            """)
+            st.markdown(_DECISION_TYPES_HELP)
+
+# Key feature cards, laid out in a four-column grid and rendered as one element
+_FEATURE_CARDS = [
+    ("🤖 Agentic AI System", "OpenAI GPT-4 integration for intelligent risk assessment and decisioning"),
+    ("🧪 A/B Testing", "Statistical comparison of different underwriting rules and strategies testing"),
+    ("📊 Real-time", "Interactive evaluation with feedback and visual indicators for reviewing"),
+    ("⚙️ Configurable", "Flexible rule engine designs with conservative, baseline, and liberal policies")
+]
+
+_FEATURE_CARDS_HTML = (
+    '<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">'
+    + "".join(
+        f'<div class="metric-card"><h3>{title}</h3><p>{description}</p></div>'
+        for title, description in _FEATURE_CARDS
+    )
+    + '</div>'
+)
 
 def show_main_dashboard():
     """Display the main dashboard content."""
@@ -288,40 +322,7 @@ def show_main_dashboard():
     
     # Key features overview
     st.markdown("## 🎯 Key Features")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>🤖 Agentic AI System</h3>
-            <p>OpenAI GPT-4 integration for intelligent risk assessment and decisioning </p> 
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>🧪 A/B Testing</h3>
-            <p>Statistical comparison of different underwriting rules and strategies testing</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>📊 Real-time</h3>
-            <p>Interactive evaluation with feedback and visual indicators for reviewing</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>⚙️ Configurable</h3>
-            <p>Flexible rule engine designs with conservative, baseline, and liberal policies</p> 
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_FEATURE_CARDS_HTML, unsafe_allow_html=True)
     
     # Quick start section
     st.markdown("## 🚀 Quick Start")
@@ -344,17 +345,15 @@ def show_main_dashboard():
     with col2:
         st.markdown("### 🎯 Quick Actions")
         
+        # Kept as a primary button for emphasis; st.page_link has no primary style
         if st.button("📋 Start Evaluation", use_container_width=True, type="primary"):
             st.switch_page("pages/02_📋_Evaluate.py")
         
-        if st.button("🧪 A/B Testing", use_container_width=True):
-            st.switch_page("pages/03_🧪_AB_Testing.py")
+        st.page_link("pages/03_🧪_AB_Testing.py", label="🧪 A/B Testing", use_container_width=True)
         
-        if st.button("⚙️ Configuration", use_container_width=True):
-            st.switch_page("pages/04_⚙️_Configuration.py")
+        st.page_link("pages/04_⚙️_Configuration.py", label="⚙️ Configuration", use_container_width=True)
         
-        if st.button("📚 Documentation", use_container_width=True):
-            st.switch_page("pages/05_📚_Documentation.py")
+        st.page_link("pages/05_📚_Documentation.py", label="📚 Documentation", use_container_width=True)
     
     # System overview
     st.markdown("## 📈 System Overview")
@@ -426,7 +425,9 @@ def show_main_dashboard():
 
 def main():
     """Main Streamlit application entry point."""
-    # Load environment variables
+    # Load environment variables (imported here so rendering the home page
+    # does not depend on the underwriting package import graph)
+    from underwriting.utils.env_loader import load_environment_variables
     load_environment_variables()
     
     # Configure page
@@ -10,11 +10,11 @@ from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-# Import the main app
-from underwriting.streamlit.app import main
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 if __name__ == "__main__":
+    # Import the main app
+    from underwriting.streamlit.app import main
     main()
 
@@ -6,26 +6,64 @@ with real-time feedback and AI-powered decision making.
 """
 
 import streamlit as st
+import pandas as pd
+import os
 import sys
 from pathlib import Path
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from typing import Optional
 import json
 import random
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from underwriting.core.models import (
     Applicant, Driver, Vehicle, Violation, Claim,
     LicenseStatus, ViolationType, ClaimType, VehicleCategory,
     UnderwritingDecision
 )
-from underwriting.core.engine import UnderwritingEngine
-from underwriting.data.sample_generator import create_sample_applicants
 from underwriting.utils.env_loader import load_environment_variables
 
+# Select box options, built once rather than on every rerun. The selectboxes
+# return enum members directly; the table columns need plain string values
+_LICENSE_OPTS = tuple(LicenseStatus)
+_VEHICLE_OPTS = tuple(VehicleCategory)
+_VIOLATION_OPTS = tuple(vtype.value for vtype in ViolationType)
+_CLAIM_OPTS = tuple(ctype.value for ctype in ClaimType)
+
+# Result card HTML, notice function and notice text for each decision
+_RESULT_CARDS = {
+    UnderwritingDecision.ACCEPT: (
+        '<div class="result-card result-accept">✅ APPLICATION ACCEPTED</div>',
+        st.success,
+        "🎉 Congratulations! The application has been approved for coverage."
+    ),
+    UnderwritingDecision.DENY: (
+        '<div class="result-card result-deny">❌ APPLICATION DENIED</div>',
+        st.error,
+        "❌ The application has been declined for coverage."
+    ),
+    UnderwritingDecision.ADJUDICATE: (
+        '<div class="result-card result-adjudicate">⚖️ MANUAL REVIEW REQUIRED</div>',
+        st.warning,
+        "⚖️ The application requires manual underwriter review."
+    )
+}
+
+# Sample selector labels mapped to indexes into the sample applicants
+_SAMPLE_LABELS = {
+    "Create New Application": None,
+    "Sample 1: Clean Record (Accept)": 0,
+    "Sample 2: Good Driver (Accept)": 1,
+    "Sample 3: Multiple DUIs (Deny)": 2,
+    "Sample 4: Coverage Lapse (Deny)": 3,
+    "Sample 5: Young Driver (Adjudicate)": 4,
+    "Sample 6: Single Violation (Adjudicate)": 5
+}
+
 def configure_page():
     """Configure the page settings."""
     st.set_page_config(
@@ -34,9 +72,8 @@ def configure_page():
         layout="wide"
     )
 
-def load_custom_css():
-    """Load custom CSS for the evaluation page."""
-    st.markdown("""
+# Custom CSS for the evaluation page, built once at import
+_CUSTOM_CSS = """
     <style>
     .evaluation-header {
         background: linear-gradient(90deg, #1f77b4, #ff7f0e);
@@ -47,15 +84,6 @@ def load_custom_css():
         text-align: center;
     }
     
-    .form-section {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        margin-bottom: 1.5rem;
-        border-left: 4px solid #1f77b4;
-    }
-    
     .result-card {
         padding: 2rem;
         border-radius: 10px;
@@ -95,12 +123,76 @@ def load_custom_css():
     .risk-medium { background-color: #fff3cd; color: #856404; }
     .risk-high { background-color: #f8d7da; color: #721c24; }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def load_custom_css():
+    """
+    Load custom CSS for the evaluation page.
+    
+    Streamlit removes elements that a rerun does not emit again, so the
+    style block is written on every run rather than once per session.
+    """
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+
+@st.cache_resource
+def get_engine():
+    """Underwriting engine shared by all sessions and reruns."""
+    # Imported here so the form renders without loading the engine
+    from underwriting.core.engine import UnderwritingEngine
+    return UnderwritingEngine()
+
+@st.cache_resource(show_spinner=False)
+def _load_environment():
+    """Load environment variables once per process rather than on every rerun."""
+    load_environment_variables()
+
+@st.cache_resource
+def _cached_samples():
+    """Sample applicants, shared as-is across reruns (st.cache_data would copy them on every call)."""
+    from underwriting.data.sample_generator import create_sample_applicants
+    return create_sample_applicants()
+
+@st.cache_data
+def _result_json(applicant_id, decision, applicant_name, credit_score, reason, timestamp):
+    """
+    Serialize an evaluation result for download, once per result.
+    
+    Args:
+        applicant_id: Applicant identifier
+        decision: Underwriting decision value
+        applicant_name: Primary driver's full name
+        credit_score: Applicant credit score
+        reason: Decision reason
+        timestamp: ISO timestamp of the evaluation
+    """
+    result_json = {
+        "applicant_id": applicant_id,
+        "decision": decision,
+        "applicant_name": applicant_name,
+        "credit_score": credit_score,
+        "reason": reason,
+        "timestamp": timestamp
+    }
+    
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(result_json, indent=2).encode('utf-8')
+    
+    return orjson.dumps(result_json, option=orjson.OPT_INDENT_2)
+
+def _enum_label(member):
+    """Display an enum member in a selectbox by its value."""
+    return member.value
 
+def _stream_into(stream, outcome):
+    """Pass an engine stream on to st.write_stream, keeping its result in outcome."""
+    outcome['result'] = yield from stream
 
 def generate_random_id():
     """Generate a random 5-digit numerical ID as a string."""
-    return f"{random.randint(10000, 99999)}"
+    return str(random.randrange(10000, 100000))
 
 def create_applicant_form():
     """Create the interactive applicant evaluation form."""
@@ -119,232 +211,218 @@ def create_applicant_form():
     with col1:
         sample_option = st.selectbox(
             "Load Sample Applicant",
-            ["Create New Application", 
-             "Sample 1: Clean Record (Accept)", 
-             "Sample 2: Good Driver (Accept)", 
-             "Sample 3: Multiple DUIs (Deny)",
-             "Sample 4: Coverage Lapse (Deny)", 
-             "Sample 5: Young Driver (Adjudicate)",
-             "Sample 6: Single Violation (Adjudicate)"
-             ],
+            list(_SAMPLE_LABELS),
             help="Select a pre-configured applicant for testing"
         )
     
+    # The loaded sample is kept in session_state so the form stays prefilled
+    # (and keeps the user's edits) on later reruns; the form below is built
+    # after this handler, so no extra rerun is needed to show it
     with col2:
         if st.button("🔄 Load Sample", use_container_width=True):
-            if sample_option != "Create New Application":
-                sampleOptionData = sample_option.split()[1]
-                sampleOptionData = sampleOptionData.replace(":", "")
-                sample_idx = int(sampleOptionData) - 1
-                samples = create_sample_applicants()
+            sample_idx = _SAMPLE_LABELS[sample_option]
+            if sample_idx is not None:
+                samples = _cached_samples()
                 if sample_idx < len(samples):
-                    print("Loading sample applicant: ", samples[sample_idx].primary_driver.first_name)
                     st.session_state.sample_applicant = samples[sample_idx]
-                    st.rerun()
+    
+    sample_applicant = st.session_state.get('sample_applicant')
     
     # Main form
     with st.form("applicant_form"):
         # Personal Information Section
-        st.markdown('<div class="form-section">', unsafe_allow_html=True)
-        st.markdown("#### 👤 Personal Information")
-        
-        col1, col2, col3, col4, col5, col6 = st.columns(6)
-        if 'sample_applicant' in st.session_state:
-            sample_applicant = st.session_state.sample_applicant
-            first_name = sample_applicant.primary_driver.first_name
-            last_name = sample_applicant.primary_driver.last_name
-            age = sample_applicant.primary_driver.age
-            license_status = sample_applicant.primary_driver.license_status.value
-            years_licensed = sample_applicant.primary_driver.years_licensed
-            email = sample_applicant.primary_driver.email
-            driver_id = sample_applicant.primary_driver.id
-            date_of_birth = sample_applicant.primary_driver.date_of_birth
-            license_number = sample_applicant.primary_driver.license_number
-            license_state = sample_applicant.primary_driver.license_state
-            license_issue_date = sample_applicant.primary_driver.license_issue_date
-            license_expiration_date = sample_applicant.primary_driver.license_expiration_date
-        else:
-            first_name = "John"
-            last_name = "Doe"
-            age = 35
-            license_status = LicenseStatus.VALID.value
-            years_licensed = 15
-            email = "john.doe@email.com"
-            driver_id = "DRIVER_12345"
-            date_of_birth = date(1988, 1, 1)
-            license_number = "LIC_123456789"
-            license_state = "CA"
-            license_issue_date = date(2010, 1, 1)
-            license_expiration_date = date(2025, 1, 1)
-
-        with col1:
-
-            first_name = st.text_input("First Name", value=first_name)
-            age = st.number_input("Age", min_value=16, max_value=100, value=age)
-        
-        with col2:
-            last_name = st.text_input("Last Name", value=last_name)
-            license_status = st.selectbox("License Status", 
-                                        [status.value for status in LicenseStatus],
-                                        index=0)
-        
-        with col3:
-            email = st.text_input("Email", value=email)
-            years_licensed = st.number_input("Years Licensed", min_value=0, max_value=50, value=years_licensed)
-        
-        with col4:
-            driver_id = st.text_input("ID", value=driver_id)
-            date_of_birth = st.date_input("Date of Birth", value=date_of_birth)
-
-        with col5:
-            license_number = st.text_input("License Number", value=license_number)
-            license_state = st.text_input("License State", value=license_state)
+        with st.container(border=True):
+            st.markdown("#### 👤 Personal Information")
+            
+            # Three columns grouping identity, driving history and license details
+            col1, col2, col3 = st.columns(3)
+            if sample_applicant is not None:
+                driver = sample_applicant.primary_driver
+                first_name = driver.first_name
+                last_name = driver.last_name
+                age = driver.age
+                license_status = driver.license_status
+                years_licensed = driver.years_licensed
+                # Driver has no email field, so it is left blank for samples
+                email = ""
+                driver_id = driver.driver_id
+                date_of_birth = driver.date_of_birth
+                license_number = driver.license_number
+                license_state = driver.license_state
+                license_issue_date = driver.license_issue_date
+                license_expiration_date = driver.license_expiration_date
+            else:
+                first_name = "John"
+                last_name = "Doe"
+                age = 35
+                license_status = LicenseStatus.VALID
+                years_licensed = 15
+                email = "john.doe@email.com"
+                driver_id = "DRIVER_12345"
+                date_of_birth = date(1988, 1, 1)
+                license_number = "LIC_123456789"
+                license_state = "CA"
+                license_issue_date = date(2010, 1, 1)
+                license_expiration_date = date(2025, 1, 1)
 
-        with col6:
-            license_issue_date = st.date_input("License Issue Date", value=license_issue_date)
-            license_expiration_date = st.date_input("License Expiration Date", value=license_expiration_date)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+            with col1:
+                first_name = st.text_input("First Name", value=first_name)
+                last_name = st.text_input("Last Name", value=last_name)
+                email = st.text_input("Email", value=email)
+                driver_id = st.text_input("ID", value=driver_id)
+            
+            with col2:
+                age = st.number_input("Age", min_value=16, max_value=100, value=age)
+                date_of_birth = st.date_input("Date of Birth", value=date_of_birth)
+                license_status = st.selectbox("License Status", 
+                                            _LICENSE_OPTS,
+                                            index=0,
+                                            format_func=_enum_label)
+                years_licensed = st.number_input("Years Licensed", min_value=0, max_value=50, value=years_licensed)
+            
+            with col3:
+                license_number = st.text_input("License Number", value=license_number)
+                license_state = st.text_input("License State", value=license_state)
+                license_issue_date = st.date_input("License Issue Date", value=license_issue_date)
+                license_expiration_date = st.date_input("License Expiration Date", value=license_expiration_date)
         
         # Financial Information Section
-        st.markdown('<div class="form-section">', unsafe_allow_html=True)
-        st.markdown("#### 💰 Financial Information")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            credit_score = st.slider("Credit Score", min_value=300, max_value=850, value=720,
-                                    help="Credit score range: 300-850")
+        with st.container(border=True):
+            st.markdown("#### 💰 Financial Information")
             
-            # Credit score indicator
-            if credit_score >= 750:
-                st.success("🟢 Excellent Credit")
-            elif credit_score >= 700:
-                st.info("🔵 Good Credit")
-            elif credit_score >= 650:
-                st.warning("🟡 Fair Credit")
-            else:
-                st.error("🔴 Poor Credit")
-        
-        with col2:
-            annual_income = st.number_input("Annual Income ($)", min_value=0, value=75000, step=1000)
-            employment_status = st.selectbox("Employment Status", 
-                                           ["Employed", "Self-Employed", "Unemployed", "Retired", "Student"])
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                credit_score = st.slider("Credit Score", min_value=300, max_value=850, value=720,
+                                        help="Credit score range: 300-850")
+                
+                # Credit score indicator
+                if credit_score >= 750:
+                    st.success("🟢 Excellent Credit")
+                elif credit_score >= 700:
+                    st.info("🔵 Good Credit")
+                elif credit_score >= 650:
+                    st.warning("🟡 Fair Credit")
+                else:
+                    st.error("🔴 Poor Credit")
+            
+            with col2:
+                annual_income = st.number_input("Annual Income ($)", min_value=0, value=75000, step=1000)
+                employment_status = st.selectbox("Employment Status", 
+                                               ["Employed", "Self-Employed", "Unemployed", "Retired", "Student"])
         
         # Coverage Information Section
-        st.markdown('<div class="form-section">', unsafe_allow_html=True)
-        st.markdown("#### 🛡️ Coverage Information")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            coverage_requested = st.multiselect("Coverage Types",
-                                              ["Liability", "Collision", "Comprehensive", "Uninsured Motorist"],
-                                              default=["Liability", "Collision"])
-        
-        with col2:
-            previous_coverage = st.checkbox("Had Previous Coverage", value=True)
-            if previous_coverage:
-                prior_insurance_lapse_days = st.number_input("Days Since Last Coverage", min_value=0, value=0)
-            else:
-                prior_insurance_lapse_days = 365  # Assume 1 year lapse if no previous coverage
-        
-        with col3:
-            policy_term = st.selectbox("Policy Term", ["6 months", "12 months"], index=1)
-            payment_method = st.selectbox("Payment Method", ["Monthly", "Quarterly", "Semi-Annual", "Annual"])
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            st.markdown("#### 🛡️ Coverage Information")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                coverage_requested = st.multiselect("Coverage Types",
+                                                  ["Liability", "Collision", "Comprehensive", "Uninsured Motorist"],
+                                                  default=["Liability", "Collision"])
+            
+            with col2:
+                previous_coverage = st.checkbox("Had Previous Coverage", value=True)
+                if previous_coverage:
+                    prior_insurance_lapse_days = st.number_input("Days Since Last Coverage", min_value=0, value=0)
+                else:
+                    prior_insurance_lapse_days = 365  # Assume 1 year lapse if no previous coverage
+            
+            with col3:
+                policy_term = st.selectbox("Policy Term", ["6 months", "12 months"], index=1)
+                payment_method = st.selectbox("Payment Method", ["Monthly", "Quarterly", "Semi-Annual", "Annual"])
         
         # Vehicle Information Section
-        st.markdown('<div class="form-section">', unsafe_allow_html=True)
-        st.markdown("#### 🚗 Vehicle Information")
-        
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        with col1:
-            vehicle_year = st.number_input("Year", min_value=1990, max_value=2025, value=2020)
-            vehicle_make = st.text_input("Make", value="Toyota")
-        
-        with col2:
-            vehicle_model = st.text_input("Model", value="Camry")
-            vehicle_value = st.number_input("Vehicle Value ($)", min_value=0, value=25000, step=1000)
-        
-        with col3:
-            vehicle_category = st.selectbox("Category", 
-                                          [cat.value for cat in VehicleCategory],
-                                          index=0)
-            annual_mileage = st.number_input("Annual Mileage", min_value=0, value=12000, step=1000)
-        
-        with col4:
-            vehicle_use = st.selectbox("Primary Use", ["Personal", "Business", "Commuting", "Pleasure"])
-            garage_type = st.selectbox("Garage Type", ["Garage", "Carport", "Street", "Driveway"])
-        
-        with col5:
-            vin = st.text_input("VIN", value="1HGBH41JXMN109186")
+        with st.container(border=True):
+            st.markdown("#### 🚗 Vehicle Information")
+            
+            col1, col2, col3, col4, col5 = st.columns(5)
+            
+            with col1:
+                vehicle_year = st.number_input("Year", min_value=1990, max_value=2025, value=2020)
+                vehicle_make = st.text_input("Make", value="Toyota")
+            
+            with col2:
+                vehicle_model = st.text_input("Model", value="Camry")
+                vehicle_value = st.number_input("Vehicle Value ($)", min_value=0, value=25000, step=1000)
+            
+            with col3:
+                vehicle_category = st.selectbox("Category", 
+                                              _VEHICLE_OPTS,
+                                              index=0,
+                                              format_func=_enum_label)
+                annual_mileage = st.number_input("Annual Mileage", min_value=0, value=12000, step=1000)
+            
+            with col4:
+                vehicle_use = st.selectbox("Primary Use", ["Personal", "Business", "Commuting", "Pleasure"])
+                garage_type = st.selectbox("Garage Type", ["Garage", "Carport", "Street", "Driveway"])
+            
+            with col5:
+                vin = st.text_input("VIN", value="1HGBH41JXMN109186")
 
-        st.markdown('</div>', unsafe_allow_html=True)
         
         # Driving History Section
-        st.markdown('<div class="form-section">', unsafe_allow_html=True)
-        st.markdown("#### 🚦 Driving History")
-        
-        # Violations
-        st.markdown("**Traffic Violations (Last 5 Years)**")
-        num_violations = st.number_input("Number of Violations", min_value=0, max_value=10, value=0)
-        
-        violations = []
-        if num_violations > 0:
-            for i in range(num_violations):
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    violation_type = st.selectbox(f"Violation {i+1} Type", 
-                                                [vtype.value for vtype in ViolationType],
-                                                key=f"violation_type_{i}")
-                with col2:
-                    violation_date = st.date_input(f"Violation {i+1} Date", 
-                                                 value=date.today() - timedelta(days=365),
-                                                 key=f"violation_date_{i}")
-                with col3:
-                    violation_fine = st.number_input(f"Fine Amount ($)", min_value=0, value=150,
-                                                   key=f"violation_fine_{i}")
-                
-                violations.append(Violation(
-                    type=ViolationType(violation_type),
-                    date=violation_date,
-                    description=f"{violation_type} violation",
-                    fine_amount=violation_fine
-                ))
-        
-        # Claims
-        st.markdown("**Insurance Claims (Last 5 Years)**")
-        num_claims = st.number_input("Number of Claims", min_value=0, max_value=10, value=0)
-        
-        claims = []
-        if num_claims > 0:
-            for i in range(num_claims):
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    claim_type = st.selectbox(f"Claim {i+1} Type",
-                                            [ctype.value for ctype in ClaimType],
-                                            key=f"claim_type_{i}")
-                with col2:
-                    claim_date = st.date_input(f"Claim {i+1} Date",
-                                             value=date.today() - timedelta(days=365),
-                                             key=f"claim_date_{i}")
-                with col3:
-                    claim_amount = st.number_input(f"Claim Amount ($)", min_value=0, value=5000,
-                                                 key=f"claim_amount_{i}")
-                
-                claims.append(Claim(
-                    type=ClaimType(claim_type),
-                    date=claim_date,
-                    amount=claim_amount,
-                    description=f"{claim_type} claim"
-                ))
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            st.markdown("#### 🚦 Driving History")
+            
+            # Violations and claims are each edited in a single table widget
+            # rather than one row of widgets per entry
+            default_incident_date = date.today() - timedelta(days=365)
+            
+            # Violations
+            st.markdown("**Traffic Violations (Last 5 Years)**")
+            violation_rows = st.data_editor(
+                pd.DataFrame({
+                    "type": pd.Series(dtype="object"),
+                    "date": pd.Series(dtype="datetime64[ns]")
+                }),
+                num_rows="dynamic",
+                column_config={
+                    "type": st.column_config.SelectboxColumn("Violation Type", options=_VIOLATION_OPTS, required=True),
+                    "date": st.column_config.DateColumn("Violation Date", default=default_incident_date, required=True)
+                },
+                use_container_width=True,
+                key="violations_editor"
+            )
+            
+            # Incomplete rows are dropped in one pass before building models
+            violations = [
+                Violation(
+                    violation_type=row.type,
+                    violation_date=pd.Timestamp(row.date).date(),
+                    description=f"{row.type} violation"
+                )
+                for row in violation_rows.dropna().itertuples(index=False)
+            ]
+            
+            # Claims
+            st.markdown("**Insurance Claims (Last 5 Years)**")
+            claim_rows = st.data_editor(
+                pd.DataFrame({
+                    "type": pd.Series(dtype="object"),
+                    "date": pd.Series(dtype="datetime64[ns]"),
+                    "amount": pd.Series(dtype="float64")
+                }),
+                num_rows="dynamic",
+                column_config={
+                    "type": st.column_config.SelectboxColumn("Claim Type", options=_CLAIM_OPTS, required=True),
+                    "date": st.column_config.DateColumn("Claim Date", default=default_incident_date, required=True),
+                    "amount": st.column_config.NumberColumn("Claim Amount ($)", min_value=0, default=5000, format="$%d", required=True)
+                },
+                use_container_width=True,
+                key="claims_editor"
+            )
+            
+            claims = [
+                Claim(
+                    claim_type=row.type,
+                    claim_date=pd.Timestamp(row.date).date(),
+                    claim_amount=float(row.amount),
+                    description=f"{row.type} claim"
+                )
+                for row in claim_rows.dropna().itertuples(index=False)
+            ]
         
         # Submit button
         col1, col2, col3 = st.columns([1, 2, 1])
@@ -359,7 +437,7 @@ def create_applicant_form():
                 first_name=first_name,
                 last_name=last_name,
                 age=age,
-                license_status=LicenseStatus(license_status),
+                license_status=license_status,
                 years_licensed=years_licensed,
                 violations=violations,
                 driver_id=driver_id,
@@ -375,8 +453,7 @@ def create_applicant_form():
                 year=vehicle_year,
                 make=vehicle_make,
                 model=vehicle_model,
-                category=VehicleCategory(vehicle_category),
-                vehicle_type=VehicleCategory(vehicle_category),
+                category=vehicle_category,
                 value=vehicle_value,
                 annual_mileage=annual_mileage,
                 vin = vin
@@ -391,10 +468,16 @@ def create_applicant_form():
                 prior_insurance_lapse_days=prior_insurance_lapse_days,
                 territory="Urban"
             )
-            # Store in session state for evaluation
+            # Store in session state for evaluation; main() shows the results
+            # later in this same run, which the form submit already triggered
             st.session_state.current_applicant = applicant
             st.session_state.show_results = True
-            st.rerun()
+
+def _show_decision(decision):
+    """Show the result card and notice for an underwriting decision."""
+    html, notify, message = _RESULT_CARDS[decision]
+    st.markdown(html, unsafe_allow_html=True)
+    notify(message)
 
 def show_evaluation_results():
     """Display the evaluation results."""
@@ -406,67 +489,31 @@ def show_evaluation_results():
     st.markdown("## 📊 Evaluation Results")
     
     # Check for OpenAI API key
-    import os
-    import random
-    if not os.environ.get('OPENAI_API_KEY'):
+    # Read on every run so a key added after the server started is picked up
+    if not os.getenv('OPENAI_API_KEY'):
         st.error("⚠️ OpenAI API key not configured. Please set OPENAI_API_KEY environment variable.")
         st.info("For testing purposes, showing mock evaluation results.")
         
         # Mock results for demonstration
-        mock_decision = UnderwritingDecision.ACCEPT if applicant.credit_score > 700 else UnderwritingDecision.ADJUDICATE
-        
-        if mock_decision == UnderwritingDecision.ACCEPT:
-            st.markdown("""
-            <div class="result-card result-accept">
-                ✅ APPLICATION ACCEPTED
-            </div>
-            """, unsafe_allow_html=True)
-            st.success("🎉 Congratulations! The application has been approved for coverage.")
-        elif mock_decision == UnderwritingDecision.DENY:
-            st.markdown("""
-            <div class="result-card result-deny">
-                ❌ APPLICATION DENIED
-            </div>
-            """, unsafe_allow_html=True)
-            st.error("❌ The application has been declined for coverage.")
+        if applicant.credit_score > 700:
+            _show_decision(UnderwritingDecision.ACCEPT)
         else:
-            st.markdown("""
-            <div class="result-card result-adjudicate">
-                ⚖️ MANUAL REVIEW REQUIRED
-            </div>
-            """, unsafe_allow_html=True)
-            st.warning("⚖️ The application requires manual underwriter review.")
+            _show_decision(UnderwritingDecision.ADJUDICATE)
         
         return
     
     # Real evaluation with AI
     try:
-        with st.spinner("🤖 AI is evaluating the application..."):
-            engine = UnderwritingEngine()
-            result = engine.evaluate_applicant(applicant)
+        # Show the response as it is generated rather than behind a spinner
+        outcome = {}
+        with st.status("🤖 AI is evaluating the application...", expanded=True) as status:
+            engine = get_engine()
+            st.write_stream(_stream_into(engine.stream_evaluate(applicant), outcome))
+            status.update(label="🤖 Evaluation complete", state="complete", expanded=False)
+        result = outcome['result']
         
         # Display results
-        if result.decision == UnderwritingDecision.ACCEPT:
-            st.markdown("""
-            <div class="result-card result-accept">
-                ✅ APPLICATION ACCEPTED
-            </div>
-            """, unsafe_allow_html=True)
-            st.success("🎉 Congratulations! The application has been approved for coverage.")
-        elif result.decision == UnderwritingDecision.DENY:
-            st.markdown("""
-            <div class="result-card result-deny">
-                ❌ APPLICATION DENIED
-            </div>
-            """, unsafe_allow_html=True)
-            st.error("❌ The application has been declined for coverage.")
-        else:
-            st.markdown("""
-            <div class="result-card result-adjudicate">
-                ⚖️ MANUAL REVIEW REQUIRED
-            </div>
-            """, unsafe_allow_html=True)
-            st.warning("⚖️ The application requires manual underwriter review.")
+        _show_decision(result.decision)
         
         # Detailed analysis
         col1, col2 = st.columns(2)
@@ -533,18 +580,16 @@ def show_evaluation_results():
                 st.code(result_text)
         
         with col2:
-            result_json = {
-                "applicant_id": applicant.applicant_id,
-                "decision": result.decision.value,
-                "applicant_name": f"{applicant.primary_driver.first_name} {applicant.primary_driver.last_name}",
-                "credit_score": applicant.credit_score,
-                "reason": result.reason,
-                "timestamp": datetime.now().isoformat()
-            }
-            
             st.download_button(
                 "📥 Download JSON",
-                data=json.dumps(result_json, indent=2),
+                data=_result_json(
+                    applicant.applicant_id,
+                    result.decision.value,
+                    f"{applicant.primary_driver.first_name} {applicant.primary_driver.last_name}",
+                    applicant.credit_score,
+                    result.reason,
+                    result.timestamp.isoformat()
+                ),
                 file_name=f"underwriting_result_{applicant.applicant_id}.json",
                 mime="application/json",
                 use_container_width=True
@@ -556,16 +601,11 @@ def show_evaluation_results():
 
 def main():
     """Main function for the evaluation page."""
-    load_environment_variables()
+    # set_page_config must come first; a cache miss below may emit a spinner
     configure_page()
+    _load_environment()
     load_custom_css()
     
-    # Load sample applicant if requested
-    if 'sample_applicant' in st.session_state:
-        st.session_state.current_applicant = st.session_state.sample_applicant
-        st.session_state.show_results = True
-        del st.session_state.sample_applicant
-    
     # Create the form
     create_applicant_form()
     
@@ -576,8 +616,8 @@ def main():
         # Reset button
         if st.button("🔄 Evaluate Another Applicant", use_container_width=True):
             st.session_state.show_results = False
-            if 'current_applicant' in st.session_state:
-                del st.session_state.current_applicant
+            st.session_state.pop('current_applicant', None)
+            st.session_state.pop('sample_applicant', None)
             st.rerun()
 
 if __name__ == "__main__":
@@ -16,11 +16,11 @@ import json
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from underwriting.testing.ab_engine import ABTestEngine, TestConfiguration
 from underwriting.testing.statistical_analysis import StatisticalAnalyzer
-from underwriting.data.sample_generator import create_sample_applicants 
 from underwriting.utils.env_loader import load_environment_variables
 
 def configure_page():
@@ -105,6 +105,63 @@ def load_custom_css():
     </style>
     """, unsafe_allow_html=True)
 
+def _rules_signature():
+    """Names and modification times of the rules files the variants load."""
+    rules_dir = Path("config") / "rules"
+    return tuple(sorted((path.name, path.stat().st_mtime_ns) for path in rules_dir.glob("*.json")))
+
+def _get_ab_engine():
+    """
+    A/B testing engine for this session, built on first use.
+    
+    The engine records every result it produces, so it is kept in
+    session_state rather than shared across sessions with st.cache_resource.
+    It is rebuilt whenever a rules file changes (e.g. when the Configuration
+    page saves one), so neither its loaded rules nor its recorded results
+    outlive the rules they came from.
+    """
+    signature = _rules_signature()
+    if st.session_state.get('_ab_engine_rules') != signature:
+        st.session_state._ab_engine = ABTestEngine()
+        st.session_state._ab_engine_rules = signature
+    return st.session_state._ab_engine
+
+@st.cache_resource
+def _cached_samples():
+    """Sample applicants, shared as-is across reruns (st.cache_data would copy them on every call)."""
+    from underwriting.data.sample_generator import create_sample_applicants
+    return create_sample_applicants()
+
+# Mock historical test results
+_TEST_HISTORY = [
+    {
+        "Date": "2024-01-15",
+        "Test": "Conservative vs Standard",
+        "Winner": "Standard",
+        "Improvement": "+12%",
+        "Significance": "High"
+    },
+    {
+        "Date": "2024-01-10",
+        "Test": "Standard vs Liberal",
+        "Winner": "Liberal",
+        "Improvement": "+8%",
+        "Significance": "Medium"
+    },
+    {
+        "Date": "2024-01-05",
+        "Test": "Prompt A vs Prompt B",
+        "Winner": "Prompt B",
+        "Improvement": "+5%",
+        "Significance": "Low"
+    }
+]
+
+@st.cache_data
+def _history_frame():
+    """Test history as a DataFrame, built once rather than on every rerun."""
+    return pd.DataFrame(_TEST_HISTORY)
+
 def show_ab_testing_interface():
     """Display the main A/B testing interface."""
     st.markdown("""
@@ -245,28 +302,30 @@ def run_ab_test_analysis():
     # Real A/B test
     try:
         with st.spinner("🧪 Running A/B test analysis..."):
-            # Initialize A/B testing engine
-            ab_engine = ABTestEngine()
-            
-            # Get sample applicants
-            sample_applicants = create_sample_applicants()
+            # A/B testing engine and sample applicants are reused across reruns
+            ab_engine = _get_ab_engine()
+            sample_applicants = _cached_samples()
             
             #print(f"Variant A: {config['variant_a']}")
             #print(f"Variant B: {config['variant_b']}")
 
-            # Run comparison
+            # Run comparison; the session's engine keeps every result for the
+            # current rules, so reruns and repeated tests of the same variants
+            # make no new LLM calls
             if config['test_type'] == "Rule Comparison":
                 results = ab_engine.run_batch_comparison(
                     sample_applicants,
                     config['variant_a'], 
-                    config['variant_b']
+                    config['variant_b'],
+                    reuse_results=True
                 )
             else:
                 # For demo, use rule comparison
                 results = ab_engine.run_batch_comparison(
                     sample_applicants,
                     config['variant_a'], 
-                    config['variant_b']
+                    config['variant_b'],
+                    reuse_results=True
                 )
             
             display_ab_results(results, config)
@@ -433,32 +492,7 @@ def show_test_history():
     """Show historical A/B test results."""
     st.markdown("## 📚 Test History")
     
-    # Mock historical data
-    history_data = [
-        {
-            "Date": "2024-01-15",
-            "Test": "Conservative vs Standard",
-            "Winner": "Standard",
-            "Improvement": "+12%",
-            "Significance": "High"
-        },
-        {
-            "Date": "2024-01-10",
-            "Test": "Standard vs Liberal",
-            "Winner": "Liberal",
-            "Improvement": "+8%",
-            "Significance": "Medium"
-        },
-        {
-            "Date": "2024-01-05",
-            "Test": "Prompt A vs Prompt B",
-            "Winner": "Prompt B",
-            "Improvement": "+5%",
-            "Significance": "Low"
-        }
-    ]
-    
-    df = pd.DataFrame(history_data)
+    df = _history_frame()
     st.dataframe(df, use_container_width=True)
     
     # Export options
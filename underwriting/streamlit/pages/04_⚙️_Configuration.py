@@ -13,7 +13,8 @@ import os
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from underwriting.utils.env_loader import load_environment_variables
 
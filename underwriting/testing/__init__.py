@@ -16,6 +16,8 @@ from .ab_engine import (
     ComparisonMetrics
 )
 
+from .response_cache import ResponseCache, CACHE_VERSION
+
 from .statistical_analysis import (
     StatisticalAnalyzer,
     BusinessImpactCalculator,
@@ -30,6 +32,10 @@ __all__ = [
     "TestResult",
     "ComparisonMetrics",
     
+    # Response Cache
+    "ResponseCache",
+    "CACHE_VERSION",
+    
     # Statistical Analysis
     "StatisticalAnalyzer",
     "BusinessImpactCalculator",
@@ -5,9 +5,12 @@ import json
 import time
 import os
 from enum import Enum
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from underwriting.core.engine import UnderwritingEngine
 from underwriting.core.models import Applicant, UnderwritingResult, UnderwritingDecision
+from underwriting.testing.response_cache import ResponseCache
 
 class TestVariant(str, Enum):
     """Test variant identifiers."""
@@ -65,15 +68,55 @@ class ComparisonMetrics:
     agreement_rate: float
     disagreement_details: List[Dict[str, Any]]
 
+# Rule configurations registered automatically by every engine
+_RULE_CONFIGURATIONS = (
+    TestConfiguration(
+        variant_id="underwriting_rules_standard",
+        name="Standard Underwriting Rules",
+        description="Default underwriting rules for standard evaluation.",
+        rules_file="underwriting_rules_standard.json"
+    ),
+    TestConfiguration(
+        variant_id="underwriting_rules_conservative",
+        name="Conservative Underwriting Rules",
+        description="More conservative underwriting rules for risk-averse evaluation.",
+        rules_file="underwriting_rules_conservative.json"
+    ),
+    TestConfiguration(
+        variant_id="underwriting_rules_liberal",
+        name="Liberal Underwriting Rules",
+        description="Liberal automobile insurance underwriting rules for risk-tolerant evaluation.",
+        rules_file="underwriting_rules_liberal.json"
+    )
+)
+
+# Short rule variant names accepted in place of the registered IDs
+_RULE_VARIANT_ALIASES = {
+    "standard": "underwriting_rules_standard",
+    "conservative": "underwriting_rules_conservative",
+    "liberal": "underwriting_rules_liberal"
+}
+
 class ABTestEngine:
     """A/B testing engine for underwriting rule comparisons."""
     
-    def __init__(self):
-        """Initialize the A/B testing engine."""
+    def __init__(self, max_concurrency: int = 8, response_cache: Optional[ResponseCache] = None):
+        """
+        Initialize the A/B testing engine.
+        
+        Args:
+            max_concurrency: Maximum number of LLM evaluations run in parallel
+            response_cache: Optional persistent cache of LLM responses reused across runs
+        """
         print("Initializing A/B Test Engine...")
+        self.max_concurrency = max_concurrency
+        self.response_cache = response_cache
         self.test_configurations: Dict[str, TestConfiguration] = {}
         self.test_results: List[TestResult] = []
         self.engines: Dict[str, UnderwritingEngine] = {}
+        
+        # Index of test_results by variant, kept in step by _record_results
+        self._results_by_variant: Dict[str, List[TestResult]] = defaultdict(list)
     
     def register_test_configuration(self, config: TestConfiguration):
         """Register a test configuration."""
@@ -90,99 +133,197 @@ class ABTestEngine:
             
             self.engines[config.variant_id] = engine
     
-    def run_single_comparison(self, applicant: Applicant, variant_a: str, variant_b: str) -> Tuple[TestResult, TestResult]:
-        """Run a single applicant through two variants and return results."""
+    def _register_rule_configurations(self):
+        """Register the built-in rule configurations that are not yet registered."""
         
-        results = []
-        self.__init__()
-        self.register_test_configuration(TestConfiguration(
-            variant_id="underwriting_rules_standard",
-            name="Standard Underwriting Rules",
-            description="Default underwriting rules for standard evaluation.",
-            rules_file="underwriting_rules_standard.json"
-        ))
-        self.register_test_configuration(TestConfiguration(
-            variant_id="underwriting_rules_conservative",
-            name="Conservative Underwriting Rules",
-            description="More conservative underwriting rules for risk-averse evaluation.",
-            rules_file="underwriting_rules_conservative.json"
-        ))
-        self.register_test_configuration(TestConfiguration(
-            variant_id="underwriting_rules_liberal",
-            name="Liberal Underwriting Rules",
-            description="Liberal automobile insurance underwriting rules for risk-tolerant evaluation.",
-            rules_file="underwriting_rules_liberal.json"
-        ))
-
-        variant_map = {
-            "standard": "underwriting_rules_standard",
-            "conservative": "underwriting_rules_conservative",
-            "liberal": "underwriting_rules_liberal"
-        }
-        variant_a = variant_map.get(variant_a, variant_a)
-        variant_b = variant_map.get(variant_b, variant_b)
-
-        for variant_id in [variant_a, variant_b]:
-            print(f"\nRunning evaluation for variant: {variant_id}")
-            if variant_id not in self.engines:
-                raise ValueError(f"Variant {variant_id} is not registered in the test configurations.")
-            
-            engine = self.engines[variant_id]
-            start_time = time.time()
-            
-            try:
-                # Run evaluation
-                underwriting_result = engine.evaluate_applicant(applicant)
-                processing_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-                
-                # Create test result
-                test_result = TestResult(
+        for config in _RULE_CONFIGURATIONS:
+            if config.variant_id not in self.test_configurations:
+                self.register_test_configuration(config)
+    
+    def _resolve_variant(self, variant_id: str) -> str:
+        """Map short rule names (e.g. "standard") to registered variant IDs."""
+        
+        variant_id = _RULE_VARIANT_ALIASES.get(variant_id, variant_id)
+        if variant_id not in self.engines:
+            raise ValueError(f"Variant {variant_id} is not registered in the test configurations.")
+        
+        return variant_id
+    
+    def _record_results(self, results: List[TestResult]):
+        """Append results to test_results and the per-variant index."""
+        
+        self.test_results.extend(results)
+        for result in results:
+            self._results_by_variant[result.variant_id].append(result)
+    
+    def get_variant_results(self, variant_id: str) -> List[TestResult]:
+        """
+        Get the recorded results for a variant.
+        
+        Args:
+            variant_id: Registered variant ID or short rule name (e.g. "standard")
+        
+        Returns:
+            Results in the order they were recorded (do not modify)
+        """
+        
+        variant_id = _RULE_VARIANT_ALIASES.get(variant_id, variant_id)
+        return self._results_by_variant.get(variant_id, [])
+    
+    def _format_applicant_data(self, applicant: Applicant, variant_id: str) -> Optional[str]:
+        """
+        Format an applicant's prompt data once for sharing between variants.
+        
+        Returns None if formatting fails, leaving each engine to format (and
+        report the failure) itself so the error is recorded per result.
+        """
+        
+        try:
+            return self.engines[variant_id]._format_applicant_data(applicant)
+        except Exception:
+            return None
+    
+    def _evaluate(self, applicant: Applicant, variant_id: str, applicant_data: Optional[str] = None) -> TestResult:
+        """
+        Evaluate a single applicant with a single variant's engine.
+        
+        Args:
+            applicant: Applicant to evaluate
+            variant_id: Registered variant ID
+            applicant_data: Pre-formatted applicant data shared between variants
+        """
+        
+        engine = self.engines[variant_id]
+        
+        # Reuse a previously recorded response for the same rules, prompt and applicant
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.make_key(engine, applicant)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return TestResult(
                     applicant_id=applicant.applicant_id,
                     variant_id=variant_id,
-                    decision=underwriting_result.decision,
-                    reason=underwriting_result.reason,
-                    triggered_rules=underwriting_result.triggered_rules,
-                    risk_factors=underwriting_result.risk_factors,
-                    processing_time_ms=processing_time,
+                    decision=UnderwritingDecision(cached["decision"]),
+                    reason=cached["reason"],
+                    triggered_rules=cached["triggered_rules"],
+                    risk_factors=cached["risk_factors"],
+                    processing_time_ms=cached["processing_time_ms"],
                     timestamp=datetime.now(),
                     error=None
                 )
-                
-            except Exception as e:
-                processing_time = (time.time() - start_time) * 1000
-                
-                test_result = TestResult(
-                    applicant_id=applicant.applicant_id,
-                    variant_id=variant_id,
-                    decision=UnderwritingDecision.ADJUDICATE,
-                    reason=f"Error: {str(e)}",
-                    triggered_rules=[],
-                    risk_factors=["System Error"],
-                    processing_time_ms=processing_time,
-                    timestamp=datetime.now(),
-                    error=str(e)
-                )
-            
+        
+        start_time = time.time()
+        
+        # OpenAI API failures come back as "System Error" results; invalid
+        # applicant data and other errors propagate rather than being
+        # recorded as ADJUDICATE decisions
+        underwriting_result = engine.evaluate_applicant(applicant, applicant_data)
+        processing_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+        system_error = "System Error" in underwriting_result.risk_factors
+        
+        # Only cache genuine LLM responses, never system errors
+        if cache_key is not None and not system_error:
+            self.response_cache.set(cache_key, {
+                "decision": underwriting_result.decision.value,
+                "reason": underwriting_result.reason,
+                "triggered_rules": underwriting_result.triggered_rules,
+                "risk_factors": underwriting_result.risk_factors,
+                "processing_time_ms": processing_time
+            })
+        
+        # Create test result
+        return TestResult(
+            applicant_id=applicant.applicant_id,
+            variant_id=variant_id,
+            decision=underwriting_result.decision,
+            reason=underwriting_result.reason,
+            triggered_rules=underwriting_result.triggered_rules,
+            risk_factors=underwriting_result.risk_factors,
+            processing_time_ms=processing_time,
+            timestamp=datetime.now(),
+            error=underwriting_result.reason if system_error else None
+        )
+    
+    def run_single_comparison(self, applicant: Applicant, variant_a: str, variant_b: str) -> Tuple[TestResult, TestResult]:
+        """Run a single applicant through two variants and return results."""
+        
+        self._register_rule_configurations()
+        variant_a = self._resolve_variant(variant_a)
+        variant_b = self._resolve_variant(variant_b)
+        
+        # Applicant formatting does not depend on the variant, so do it once
+        applicant_data = self._format_applicant_data(applicant, variant_a)
+        
+        results = []
+        for variant_id in [variant_a, variant_b]:
+            print(f"\nRunning evaluation for variant: {variant_id}")
+            test_result = self._evaluate(applicant, variant_id, applicant_data)
             results.append(test_result)
-            self.test_results.append(test_result)
+            self._record_results([test_result])
         
         return results[0], results[1]
     
-    def run_batch_comparison(self, applicants: List[Applicant], variant_a: str, variant_b: str) -> List[Tuple[TestResult, TestResult]]:
-        """Run a batch of applicants through two variants."""
+    def run_batch_comparison(self, applicants: List[Applicant], variant_a: str, variant_b: str,
+                             reuse_results: bool = False) -> List[Tuple[TestResult, TestResult]]:
+        """
+        Run a batch of applicants through two variants.
+        
+        Args:
+            applicants: Applicants to evaluate
+            variant_a: First variant ID or short rule name
+            variant_b: Second variant ID or short rule name
+            reuse_results: Reuse results already recorded for an applicant and
+                variant (e.g. by an earlier pair in a test suite) instead of
+                evaluating it again
+        """
         
         print(f"\n{'='*80}")
         print(f"A/B TEST: {variant_a.upper()} vs {variant_b.upper()}")
         print(f"{'='*80}")
         print(f"Testing {len(applicants)} applicants...")
         
-        batch_results = []
-        
-        for i, applicant in enumerate(applicants):
-            print(f"\nProcessing applicant {i+1}/{len(applicants)}: {applicant.applicant_id}")
+        self._register_rule_configurations()
+        variant_id_a = self._resolve_variant(variant_a)
+        variant_id_b = self._resolve_variant(variant_b)
+        
+        recorded_a: Dict[str, TestResult] = {}
+        recorded_b: Dict[str, TestResult] = {}
+        if reuse_results:
+            recorded_a = {r.applicant_id: r for r in self._results_by_variant.get(variant_id_a, [])}
+            recorded_b = {r.applicant_id: r for r in self._results_by_variant.get(variant_id_b, [])}
+        
+        # LLM calls are I/O bound, so evaluate every missing applicant/variant pair concurrently
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            pending = []
+            for applicant in applicants:
+                result_a = recorded_a.get(applicant.applicant_id)
+                result_b = recorded_b.get(applicant.applicant_id)
+                
+                # Applicant formatting does not depend on the variant, so do it once
+                applicant_data = None
+                if result_a is None or result_b is None:
+                    applicant_data = self._format_applicant_data(applicant, variant_id_a)
+                
+                if result_a is None:
+                    result_a = executor.submit(self._evaluate, applicant, variant_id_a, applicant_data)
+                if result_b is None:
+                    result_b = executor.submit(self._evaluate, applicant, variant_id_b, applicant_data)
+                pending.append((result_a, result_b))
             
-            result_a, result_b = self.run_single_comparison(applicant, variant_a, variant_b)
-            batch_results.append((result_a, result_b))
+            # Resolve futures in applicant order, recording only new evaluations
+            batch_results = []
+            for result_a, result_b in pending:
+                pair = []
+                for result in (result_a, result_b):
+                    if isinstance(result, Future):
+                        result = result.result()
+                        self._record_results([result])
+                    pair.append(result)
+                batch_results.append((pair[0], pair[1]))
+        
+        for i, (applicant, (result_a, result_b)) in enumerate(zip(applicants, batch_results)):
+            print(f"\nProcessing applicant {i+1}/{len(applicants)}: {applicant.applicant_id}")
             
             # Show quick comparison
             agreement = "✓" if result_a.decision == result_b.decision else "✗"
@@ -192,12 +333,74 @@ class ABTestEngine:
         
         return batch_results
     
+    def run_variants(self, applicants: List[Applicant], variant_ids: List[str]) -> Dict[str, List[TestResult]]:
+        """
+        Evaluate every applicant with every variant in one concurrent batch.
+        
+        Results already recorded for an applicant and variant are reused, and
+        new results are recorded, so comparisons run afterwards with
+        ``reuse_results=True`` need no further LLM calls.
+        
+        Args:
+            applicants: Applicants to evaluate
+            variant_ids: Variant IDs or short rule names
+        
+        Returns:
+            Results per requested variant, in applicant order
+        """
+        
+        self._register_rule_configurations()
+        resolved = {variant: self._resolve_variant(variant) for variant in variant_ids}
+        
+        # Applicant formatting does not depend on the variant, so do it once
+        first_variant = next(iter(resolved.values()), None)
+        applicant_data = {}
+        if first_variant is not None:
+            applicant_data = {
+                applicant.applicant_id: self._format_applicant_data(applicant, first_variant)
+                for applicant in applicants
+            }
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            pending: Dict[str, list] = {}
+            for variant, variant_id in resolved.items():
+                recorded = {r.applicant_id: r for r in self._results_by_variant.get(variant_id, [])}
+                pending[variant] = [
+                    recorded.get(applicant.applicant_id)
+                    or executor.submit(self._evaluate, applicant, variant_id, applicant_data[applicant.applicant_id])
+                    for applicant in applicants
+                ]
+            
+            # Resolve futures, recording only new evaluations
+            matrix: Dict[str, List[TestResult]] = {}
+            for variant, results in pending.items():
+                matrix[variant] = []
+                for result in results:
+                    if isinstance(result, Future):
+                        result = result.result()
+                        self._record_results([result])
+                    matrix[variant].append(result)
+        
+        return matrix
+    
+    def run_single_variant(self, applicants: List[Applicant], variant_id: str) -> List[TestResult]:
+        """Run a batch of applicants through a single variant concurrently."""
+        
+        self._register_rule_configurations()
+        variant_id = self._resolve_variant(variant_id)
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            results = list(executor.map(lambda applicant: self._evaluate(applicant, variant_id), applicants))
+        
+        self._record_results(results)
+        return results
+    
     def calculate_comparison_metrics(self, variant_a: str, variant_b: str) -> ComparisonMetrics:
         """Calculate comparison metrics between two variants."""
         
-        # Filter results for the two variants
-        results_a = [r for r in self.test_results if r.variant_id == variant_a]
-        results_b = [r for r in self.test_results if r.variant_id == variant_b]
+        # Look up results for the two variants
+        results_a = self.get_variant_results(variant_a)
+        results_b = self.get_variant_results(variant_b)
         
         # Ensure we have matching applicants
         applicant_ids_a = {r.applicant_id for r in results_a}
@@ -219,13 +422,11 @@ class ABTestEngine:
             if total == 0:
                 return 0.0, 0.0, 0.0
             
-            accept_count = sum(1 for r in results if r.decision == UnderwritingDecision.ACCEPT)
-            deny_count = sum(1 for r in results if r.decision == UnderwritingDecision.DENY)
-            adjudicate_count = sum(1 for r in results if r.decision == UnderwritingDecision.ADJUDICATE)
+            counts = Counter(r.decision for r in results)
             
-            return (accept_count / total * 100, 
-                   deny_count / total * 100, 
-                   adjudicate_count / total * 100)
+            return (counts[UnderwritingDecision.ACCEPT] / total * 100, 
+                   counts[UnderwritingDecision.DENY] / total * 100, 
+                   counts[UnderwritingDecision.ADJUDICATE] / total * 100)
         
         accept_rate_a, deny_rate_a, adjudicate_rate_a = calculate_rates(results_a)
         accept_rate_b, deny_rate_b, adjudicate_rate_b = calculate_rates(results_b)
@@ -368,5 +569,6 @@ class ABTestEngine:
     def clear_results(self):
         """Clear all test results."""
         self.test_results.clear()
+        self._results_by_variant.clear()
         print("Test results cleared.")
 
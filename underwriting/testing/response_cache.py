@@ -0,0 +1,80 @@
+"""
+Persistent cache of LLM underwriting responses for A/B testing.
+
+Responses are keyed on the rules and prompt text an engine evaluates with,
+together with the applicant data, so repeated comparisons and re-runs of a
+test suite reuse earlier evaluations instead of calling the LLM again.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+
+# Bump to invalidate all previously cached responses
+CACHE_VERSION = 2
+
+
+class ResponseCache:
+    """SQLite-backed cache of underwriting responses."""
+
+    def __init__(self, path: str = ".ab_cache.sqlite3"):
+        """
+        Open (or create) the response cache.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def make_key(engine: Any, applicant: Any) -> str:
+        """
+        Build the cache key for evaluating an applicant with an engine.
+
+        Args:
+            engine: UnderwritingEngine configured for the variant
+            applicant: Applicant being evaluated
+
+        Returns:
+            Hex digest identifying the rules, prompt and applicant data
+        """
+        prompt_template = engine.prompt_template
+        payload = {
+            "version": CACHE_VERSION,
+            "rules": engine.rules,
+            "prompt_template": getattr(prompt_template, "template", prompt_template),
+            "applicant": applicant.model_dump(mode="json")
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for a key, or None on a miss."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT result FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a response under a key, replacing any previous entry."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, result) VALUES (?, ?)",
+                (key, json.dumps(result))
+            )
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
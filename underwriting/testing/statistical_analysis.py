@@ -1,8 +1,9 @@
 import math
-from typing import List, Dict, Any, Tuple, Optional
+from collections import Counter
+from typing import List, Dict, Any, Tuple, Optional, Sequence
 from dataclasses import dataclass
-#from scipy import stats
-#import numpy as np
+from scipy import stats
+import numpy as np
 from .ab_engine import ComparisonMetrics, TestResult
 
 @dataclass
@@ -60,7 +61,7 @@ class StatisticalAnalyzer:
         def count_decisions(results):
             counts = {'accept': 0, 'deny': 0, 'adjudicate': 0}
             for result in results:
-                counts[result.decision.value] += 1
+                counts[result.decision] += 1
             return counts
         
         counts_a = count_decisions(results_a)
@@ -97,9 +98,10 @@ class StatisticalAnalyzer:
                          decision_type: str) -> StatisticalTest:
         """Perform two-proportion z-test for specific decision type."""
         
-        # Count specific decision type
-        count_a = sum(1 for r in results_a if r.decision.value == decision_type)
-        count_b = sum(1 for r in results_b if r.decision.value == decision_type)
+        # Count specific decision type (UnderwritingDecision is a str enum,
+        # so members compare equal to their values directly)
+        count_a = sum(1 for r in results_a if r.decision == decision_type)
+        count_b = sum(1 for r in results_b if r.decision == decision_type)
         
         n_a = len(results_a)
         n_b = len(results_b)
@@ -147,6 +149,63 @@ class StatisticalAnalyzer:
             interpretation=interpretation
         )
     
+    def proportion_z_tests(self, results_a: List[TestResult], results_b: List[TestResult],
+                           decision_types: Sequence[str] = ('accept', 'deny', 'adjudicate')) -> List[StatisticalTest]:
+        """
+        Perform two-proportion z-tests for several decision types at once.
+        
+        Equivalent to calling ``proportion_z_test`` for each decision type,
+        but counts each variant's decisions in a single pass and evaluates
+        all the tests with one vectorized scipy call.
+        """
+        
+        n_a = len(results_a)
+        n_b = len(results_b)
+        
+        if n_a == 0 or n_b == 0:
+            return [self.proportion_z_test(results_a, results_b, decision_type)
+                    for decision_type in decision_types]
+        
+        # Count every decision type in one pass per variant
+        counts_a = Counter(r.decision for r in results_a)
+        counts_b = Counter(r.decision for r in results_b)
+        count_a = np.array([counts_a[decision_type] for decision_type in decision_types], dtype=float)
+        count_b = np.array([counts_b[decision_type] for decision_type in decision_types], dtype=float)
+        
+        p_a = count_a / n_a
+        p_b = count_b / n_b
+        
+        # Pooled proportions and standard errors
+        p_pool = (count_a + count_b) / (n_a + n_b)
+        se = np.sqrt(p_pool * (1 - p_pool) * (1/n_a + 1/n_b))
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_stats = np.where(se > 0, (p_a - p_b) / se, 0.0)
+        p_values = np.where(se > 0, 2 * (1 - stats.norm.cdf(np.abs(z_stats))), 1.0)
+        
+        # Effect sizes (Cohen's h)
+        cohens_h = 2 * (np.arcsin(np.sqrt(p_a)) - np.arcsin(np.sqrt(p_b)))
+        
+        tests = []
+        for i, decision_type in enumerate(decision_types):
+            p_value = float(p_values[i])
+            is_significant = p_value < self.alpha
+            interpretation = self._interpret_proportion_test(
+                float(p_a[i]), float(p_b[i]), p_value, float(cohens_h[i]), is_significant, decision_type
+            )
+            
+            tests.append(StatisticalTest(
+                test_name=f"Two-Proportion Z-Test ({decision_type})",
+                statistic=float(z_stats[i]),
+                p_value=p_value,
+                is_significant=is_significant,
+                confidence_level=self.confidence_level,
+                effect_size=abs(float(cohens_h[i])),
+                interpretation=interpretation
+            ))
+        
+        return tests
+    
     def t_test_processing_time(self, results_a: List[TestResult], results_b: List[TestResult]) -> StatisticalTest:
         """Perform t-test for processing time differences."""
         
@@ -192,7 +251,7 @@ class StatisticalAnalyzer:
     def confidence_interval_proportion(self, results: List[TestResult], decision_type: str) -> Tuple[float, float]:
         """Calculate confidence interval for a proportion."""
         
-        count = sum(1 for r in results if r.decision.value == decision_type)
+        count = sum(1 for r in results if r.decision == decision_type)
         n = len(results)
         
         if n == 0:
@@ -0,0 +1,16 @@
+"""
+ASGI entry point for serving the Flask application with an ASGI server.
+
+Usage:
+    uvicorn underwriting.web.asgi:app --workers 4
+
+The Flask views are synchronous, so WsgiToAsgi runs each request in a worker
+thread. Views only stop holding a thread during LLM calls once they are
+rewritten as ``async def`` views that await ``evaluate_applicant_async``.
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+
+from .app import create_app
+
+app = WsgiToAsgi(create_app())